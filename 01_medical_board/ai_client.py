@@ -2,10 +2,51 @@
 AI Client for OpenRouter API communication
 """
 import json
+import random
+import re
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Tuple
-from config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, MAX_RETRIES, REQUEST_TIMEOUT, RATE_LIMIT_DELAY
+from config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, MAX_RETRIES, REQUEST_TIMEOUT, RATE_LIMIT_DELAY, RETRY_BACKOFF_CAP, HTTP_POOL_SIZE
+
+
+VALID_CHOICES = ("A", "B", "C", "D")
+CHOICE_SEPARATORS = (":", ".", ")", " ")
+
+# Fallback answer patterns, compiled once instead of on every parse
+ANSWER_LABEL_PATTERN = re.compile(r'Answer:\s*([ABCD])', re.IGNORECASE)
+ANSWER_IS_PATTERN = re.compile(r'(?:the\s+)?answer\s+is\s+([ABCD])', re.IGNORECASE)
+I_CHOOSE_PATTERN = re.compile(r'I\s+(?:choose|select)\s+([ABCD])', re.IGNORECASE)
+LEADING_LETTER_PATTERN = re.compile(r'^([ABCD])\b', re.IGNORECASE)
+JSON_BLOCK_PATTERN = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Function-calling schema sent with every question; it never changes, so build it once
+SELECT_ANSWER_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "select_answer",
+            "description": "Select the correct answer choice (A, B, C, or D) for the medical coding question",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "choice": {
+                        "type": "string",
+                        "enum": ["A", "B", "C", "D"],
+                        "description": "The selected answer choice"
+                    },
+                    "reasoning": {
+                        "type": "string",
+                        "description": "Brief explanation of why this choice is correct"
+                    }
+                },
+                "required": ["choice", "reasoning"]
+            }
+        }
+    }
+]
+SELECT_ANSWER_TOOL_CHOICE = {"type": "function", "function": {"name": "select_answer"}}
 
 
 class AIClient:
@@ -15,6 +56,11 @@ class AIClient:
         self.api_key = OPENROUTER_API_KEY
         self.base_url = OPENROUTER_BASE_URL
         self.session = requests.Session()
+        # Size the connection pool for concurrent doctors/questions so keep-alive connections
+        # are reused instead of being dropped once more than the default 10 are in flight
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -56,31 +102,8 @@ class AIClient:
             "messages": messages,
             "temperature": 0.1,  # Low temperature for consistent medical coding
             "max_tokens": max_tokens,
-            "tools": [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": "select_answer",
-                        "description": "Select the correct answer choice (A, B, C, or D) for the medical coding question",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {
-                                "choice": {
-                                    "type": "string",
-                                    "enum": ["A", "B", "C", "D"],
-                                    "description": "The selected answer choice"
-                                },
-                                "reasoning": {
-                                    "type": "string",
-                                    "description": "Brief explanation of why this choice is correct"
-                                }
-                            },
-                            "required": ["choice", "reasoning"]
-                        }
-                    }
-                }
-            ],
-            "tool_choice": {"type": "function", "function": {"name": "select_answer"}}
+            "tools": SELECT_ANSWER_TOOLS,
+            "tool_choice": SELECT_ANSWER_TOOL_CHOICE
         }
         
         for attempt in range(MAX_RETRIES):
@@ -92,7 +115,10 @@ class AIClient:
                 )
                 response.raise_for_status()
                 
-                result = response.json()
+                # Parse the body bytes directly; the raw response is the body text as received,
+                # so it is never re-serialized
+                result = json.loads(response.content)
+                raw_response = response.text
                 
                 # Extract the tool call result
                 if "choices" in result and len(result["choices"]) > 0:
@@ -103,7 +129,6 @@ class AIClient:
                             function_args = json.loads(tool_call["function"]["arguments"])
                             selected_choice = function_args.get("choice")
                             reasoning = function_args.get("reasoning")
-                            raw_response = json.dumps(result, indent=2)
                             
                             # Validate the choice
                             if selected_choice in ["A", "B", "C", "D"]:
@@ -116,47 +141,55 @@ class AIClient:
                     # For Gemini models: check reasoning_details first (they often put the real answer here)
                     selected_choice, reasoning = self._parse_reasoning_details(result)
                     if selected_choice:
-                        return selected_choice, reasoning, json.dumps(result, indent=2)
+                        return selected_choice, reasoning, raw_response
                     
                     # Try to parse from main content
                     content = result["choices"][0]["message"]["content"]
                     if content:
                         selected_choice, reasoning = self._parse_response(content)
                         if selected_choice:
-                            return selected_choice, reasoning, json.dumps(result, indent=2)
+                            return selected_choice, reasoning, raw_response
                         
                         # Try to parse JSON from content (for models that return JSON instead of tool calls)
                         selected_choice, reasoning = self._parse_json_response(content)
                         if selected_choice:
-                            return selected_choice, reasoning, json.dumps(result, indent=2)
+                            return selected_choice, reasoning, raw_response
                 
                 print(f"Unexpected response format from {model_id}")
-                print(f"Response preview: {json.dumps(result, indent=2)[:500]}...")
-                return None, None, json.dumps(result, indent=2)
+                print(f"Response preview: {raw_response[:500]}...")
+                return None, None, raw_response
                 
             except requests.exceptions.RequestException as e:
                 print(f"Request error for {model_id} (attempt {attempt + 1}): {e}")
+                # Client errors (bad request, auth, unknown model) won't succeed on retry; rate limits will
+                status_code = e.response.status_code if e.response is not None else None
+                if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                    return None, f"Request rejected with HTTP {status_code}: {e}", None
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RATE_LIMIT_DELAY * (attempt + 1))
+                    time.sleep(self._retry_delay(attempt))
                 else:
                     return None, f"Request failed after {MAX_RETRIES} attempts: {e}", None
             
             except json.JSONDecodeError as e:
                 print(f"JSON decode error for {model_id}: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RATE_LIMIT_DELAY)
+                    time.sleep(self._retry_delay(attempt))
                 else:
                     return None, f"JSON decode failed: {e}", None
             
             except Exception as e:
                 print(f"Unexpected error for {model_id}: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RATE_LIMIT_DELAY)
+                    time.sleep(self._retry_delay(attempt))
                 else:
                     return None, f"Unexpected error: {e}", None
         
         return None, "Failed after all retry attempts", None
     
+    def _retry_delay(self, attempt: int) -> float:
+        """Capped exponential backoff with random jitter, so concurrent callers that failed together don't retry in lockstep"""
+        return min(RETRY_BACKOFF_CAP, RATE_LIMIT_DELAY * 2 ** attempt) * random.uniform(0.5, 1.5)
+    
     def _format_question(self, question: str, choices: Dict[str, str]) -> str:
         """Format the question with multiple choice options"""
         formatted = f"{question}\n\n"
@@ -176,39 +209,33 @@ class AIClient:
         
         content = content.strip()
         
-        # Look for choice at the beginning of the response
-        for choice in ["A", "B", "C", "D"]:
-            if content.startswith(choice + ":") or content.startswith(choice + ".") or content.startswith(choice + ")"):
-                reasoning = content[2:].strip()
-                return choice, reasoning
-            elif content.startswith(choice + " "):
-                reasoning = content[2:].strip()
-                return choice, reasoning
+        # Look for choice at the beginning of the response, e.g. "A: ...", "B. ...", "C) ..." or "D ..."
+        if content[:1] in VALID_CHOICES and content[1:2] in CHOICE_SEPARATORS:
+            return content[0], content[2:].strip()
         
         # Look for "Answer: X" pattern
-        import re
-        answer_match = re.search(r'Answer:\s*([ABCD])', content, re.IGNORECASE)
+        answer_match = ANSWER_LABEL_PATTERN.search(content)
         if answer_match:
             choice = answer_match.group(1).upper()
             reasoning = content
             return choice, reasoning
         
         # Look for "The answer is X" pattern
-        answer_match = re.search(r'(?:the\s+)?answer\s+is\s+([ABCD])', content, re.IGNORECASE)
+        answer_match = ANSWER_IS_PATTERN.search(content)
         if answer_match:
             choice = answer_match.group(1).upper()
             reasoning = content
             return choice, reasoning
         
         # Look for "I choose X" or "I select X" pattern
-        choice_match = re.search(r'I\s+(?:choose|select)\s+([ABCD])', content, re.IGNORECASE)
+        choice_match = I_CHOOSE_PATTERN.search(content)
         if choice_match:
             choice = choice_match.group(1).upper()
             reasoning = content
             return choice, reasoning
         
         # Look for standalone letter followed by explanation
-        letter_match = re.search(r'^([ABCD])\b', content, re.IGNORECASE)
+        letter_match = LEADING_LETTER_PATTERN.search(content)
         if letter_match:
             choice = letter_match.group(1).upper()
             reasoning = content
@@ -237,9 +264,7 @@ class AIClient:
         
         try:
             # Look for JSON blocks in the content
-            import re
-            json_pattern = r'```json\s*(\{.*?\})\s*```'
-            json_match = re.search(json_pattern, content, re.DOTALL)
+            json_match = JSON_BLOCK_PATTERN.search(content)
             
             if json_match:
                 json_str = json_match.group(1)
@@ -0,0 +1,69 @@
+"""
+Persistent cache of AI model answers, keyed by model and question content
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class AnswerCache:
+    """SQLite-backed store of (selected_choice, reasoning, raw_response, response_time) per model and question"""
+    
+    def __init__(self, db_path: str, ttl_secs: Optional[int] = None, max_entries: Optional[int] = None):
+        self.db_path = db_path
+        self.ttl_secs = ttl_secs
+        self.max_entries = max_entries
+        self._lock = threading.Lock()  # One connection shared by the request threads
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "key TEXT PRIMARY KEY, selected TEXT, reasoning TEXT, raw TEXT, ts INTEGER, response_time REAL)"
+        )
+        # Caches written before response times were stored get the column; their rows read as misses
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(answers)")}
+        if "response_time" not in columns:
+            self._conn.execute("ALTER TABLE answers ADD COLUMN response_time REAL")
+        self._prune()
+        self._conn.commit()
+    
+    def _prune(self):
+        """Drop expired entries and the oldest ones beyond max_entries (run once when opened)"""
+        if self.ttl_secs is not None:
+            self._conn.execute("DELETE FROM answers WHERE ts < ?", (int(time.time()) - self.ttl_secs,))
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM answers WHERE key NOT IN "
+                "(SELECT key FROM answers ORDER BY ts DESC LIMIT ?)", (self.max_entries,)
+            )
+    
+    @staticmethod
+    def make_key(model_id: str, system_prompt: str, question: str, choices: Dict[str, str]) -> str:
+        """Hash everything the model sees, so any change to the prompt is a cache miss"""
+        payload = "|".join((model_id, system_prompt, question, json.dumps(choices, sort_keys=True)))
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, Optional[str], Optional[str], float]]:
+        """Return the cached answer tuple with the original response time, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT selected, reasoning, raw, ts, response_time FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[4] is None:
+            return None
+        if self.ttl_secs is not None and time.time() - row[3] > self.ttl_secs:
+            return None
+        return row[0], row[1], row[2], row[4]
+    
+    def put(self, key: str, selected: str, reasoning: Optional[str], raw: Optional[str], response_time: float):
+        """Store an answer, with how long the API took to give it, for later runs"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (key, selected, reasoning, raw, ts, response_time) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, selected, reasoning, raw, int(time.time()), response_time)
+            )
+            self._conn.commit()
+
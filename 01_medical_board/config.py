@@ -141,9 +141,22 @@ You must respond with only A, B, C, or D followed by a brief explanation of your
 # File paths
 QUESTIONS_FILE = "../00_question_banks/final_questions.json"
 RESULTS_DIR = "../02_test_attempts"
+RESULTS_JSON_INDENT = 2  # None writes compact results files with the much faster C JSON encoder
 
 # Testing configuration
-MAX_RETRIES = 3
+MAX_RETRIES = 4
 REQUEST_TIMEOUT = 60
 RATE_LIMIT_DELAY = 0.5  # Reduced for parallel processing
-PARALLEL_WORKERS = 10  # Max concurrent requests per doctor 
\ No newline at end of file
+RETRY_BACKOFF_CAP = 16  # Longest wait between retries of a failed request (seconds)
+RAW_RESPONSE_MAX_CHARS = 2048  # Raw API response kept per answered question in results files (None keeps it all)
+PARALLEL_WORKERS = 10  # Max concurrent requests per doctor
+HTTP_POOL_SIZE = 64  # Keep-alive connections shared by all concurrent requests (>= agents x workers)
+MODEL_REQUESTS_PER_SECOND = 10  # Sustained request rate allowed per model
+MODEL_REQUEST_BURST = 10  # Requests a model may receive back-to-back before throttling kicks in
+
+# Answer cache: replay a model's earlier answer to an identical prompt instead of calling the API again.
+# Off by default, since repeated runs are usually meant to sample fresh answers
+ANSWER_CACHE_ENABLED = False
+ANSWER_CACHE_FILE = "../02_test_attempts/answer_cache.sqlite3"
+ANSWER_CACHE_TTL_SECS = 7 * 24 * 60 * 60  # Entries older than a week are ignored and pruned
+ANSWER_CACHE_MAX_ENTRIES = 100000
@@ -7,21 +7,96 @@ Includes parallel processing for faster testing at both question and agent level
 """
 import json
 import os
+import sys
 import asyncio
+import random
+import re
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from ai_client import AIClient
-from config import AI_DOCTORS, SYSTEM_PROMPTS, PARALLEL_WORKERS, RATE_LIMIT_DELAY
+from config import (AI_DOCTORS, SYSTEM_PROMPTS, PARALLEL_WORKERS, RATE_LIMIT_DELAY, RESULTS_DIR,
+                    MODEL_REQUESTS_PER_SECOND, MODEL_REQUEST_BURST, ANSWER_CACHE_ENABLED,
+                    ANSWER_CACHE_FILE, ANSWER_CACHE_TTL_SECS, ANSWER_CACHE_MAX_ENTRIES, RAW_RESPONSE_MAX_CHARS,
+                    RESULTS_JSON_INDENT)
+from rate_limit import TokenBucket
+from answer_cache import AnswerCache
 
 # Default settings for agent-level parallelism
 DEFAULT_MAX_CONCURRENT_AGENTS = 4
 
+# Buffer size for writing results files, so json.dump's many small chunks coalesce into few writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Prompt for question types without a dedicated system prompt, resolved once at import
+DEFAULT_SYSTEM_PROMPT = SYSTEM_PROMPTS['other']
+
+# Results file name: "<doctor stem>_<YYYYMMDD>_<HHMMSS>.json", stamped when the file is saved
+RESULT_FILE_PATTERN = re.compile(r"(.+)_(\d{8})_\d{6}\.json")
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path: str, signature: Tuple[int, int]):
+    """Parse a JSON file once per (mtime, size) signature; shared by every MedicalBoardTest"""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _load_json_file(path: str):
+    """Load a JSON file, reusing the parsed data until the file changes on disk"""
+    stat = os.stat(path)
+    return _load_json_cached(path, (stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=None)
+def _load_answers_cached(path: str, signature: Tuple[int, int]) -> Dict:
+    """Build the question number -> correct answer lookup once per (mtime, size) signature"""
+    answers_list = _load_json_cached(path, signature)
+    
+    # Convert list to dictionary for quick lookup
+    answers_dict = {}
+    for answer_item in answers_list:
+        question_number = answer_item.get('question_number')
+        correct_answer = answer_item.get('correct_answer')
+        if question_number and correct_answer:
+            answers_dict[question_number] = correct_answer
+    
+    return answers_dict
+
+
+@lru_cache(maxsize=None)
+def _shared_ai_client() -> AIClient:
+    """One AIClient per process, so every test run reuses the same keep-alive connection pool"""
+    return AIClient()
+
+
+# Threads for blocking API calls, shared by every MedicalBoardTest (e.g. the vanilla and enhanced runs of --all).
+# Always fetch it through _shared_request_executor when submitting work, never keep a reference: growing the
+# pool replaces it, and the old pool only finishes the work it already has
+_request_executor: Optional[ThreadPoolExecutor] = None
+_request_executor_size = 0
+
+
+def _shared_request_executor(max_threads: int) -> ThreadPoolExecutor:
+    """Get the process-wide request thread pool, growing it if more concurrency is needed"""
+    global _request_executor, _request_executor_size
+    if _request_executor is None or _request_executor_size < max_threads:
+        if _request_executor is not None:
+            _request_executor.shutdown(wait=False)
+        _request_executor = ThreadPoolExecutor(max_workers=max_threads)
+        _request_executor_size = max_threads
+    return _request_executor
+
 
 class TestResult:
     """Result from a single question test"""
+    __slots__ = ('question_number', 'question', 'question_type', 'choices', 'correct_answer',
+                 'selected_answer', 'reasoning', 'response_time', 'raw_response', 'success',
+                 'error_message')
+    
     def __init__(self, question_number: int, question: str, question_type: str, choices: Dict[str, str], 
                  correct_answer: str, selected_answer: Optional[str], 
                  reasoning: Optional[str], response_time: float = 0.0, 
@@ -39,8 +114,29 @@ class TestResult:
         self.error_message = error_message
 
 
+def _test_result_to_json(obj):
+    """Convert a TestResult into its results-file entry while the file is being written"""
+    if isinstance(obj, TestResult):
+        return {
+            "question_number": obj.question_number,
+            "question": obj.question,
+            "question_type": obj.question_type,
+            "choices": obj.choices,
+            "selected_answer": obj.selected_answer,
+            "reasoning": obj.reasoning,
+            "response_time": obj.response_time,
+            "raw_response": obj.raw_response,
+            "success": obj.success,
+            "error_message": obj.error_message
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class DoctorTestResults:
     """Results from testing a single AI doctor"""
+    __slots__ = ('doctor_name', 'model_id', 'results', 'total_questions', 'completed_answers',
+                 'total_response_time')
+    
     def __init__(self, doctor_name: str, model_id: str):
         self.doctor_name = doctor_name
         self.model_id = model_id
@@ -66,14 +162,14 @@ class EmbeddingsLoader:
     def __init__(self, embeddings_file: str = "../00_hcpcs_icd_apis/question_embeddings.json"):
         self.embeddings_file = embeddings_file
         self.embeddings = {}
+        self._context_cache: Dict[int, str] = {}  # Formatted context per question, shared by every agent
         self.load_embeddings()
     
     def load_embeddings(self):
-        """Load embeddings from the JSON file"""
+        """Load embeddings from the JSON file (parsed once and shared while the file is unchanged)"""
         if os.path.exists(self.embeddings_file):
             try:
-                with open(self.embeddings_file, 'r') as f:
-                    embeddings_data = json.load(f)
+                embeddings_data = _load_json_file(self.embeddings_file)
                 
                 # Index by question number for quick lookup
                 for question_data in embeddings_data:
@@ -94,7 +190,11 @@ class EmbeddingsLoader:
         return self.embeddings.get(question_number)
     
     def format_embeddings_context(self, question_number: int) -> str:
-        """Format embeddings as additional context for AI models"""
+        """Format embeddings as additional context for AI models (built once per question)"""
+        cached = self._context_cache.get(question_number)
+        if cached is not None:
+            return cached
+        
         embeddings = self.get_embeddings_for_question(question_number)
         if not embeddings:
             return ""
@@ -109,19 +209,26 @@ class EmbeddingsLoader:
                 context += f"• {choice.get('choice', '')}: {code} - {description}\n"
         
         context += "\nPlease use this information to help inform your answer.\n"
-        return context if len(context) > 50 else ""  # Only return if we have meaningful content
+        context = context if len(context) > 50 else ""  # Only return if we have meaningful content
+        self._context_cache[question_number] = context
+        return context
 
 
 class MedicalBoardTest:
     """Main test runner for medical board tests"""
     
-    def __init__(self, use_embeddings: bool = False, max_workers: int = None, questions_file: str = "../00_question_banks/final_questions.json"):
-        self.ai_client = AIClient()
+    def __init__(self, use_embeddings: bool = False, max_workers: int = None, questions_file: str = "../00_question_banks/final_questions.json",
+                 resume: bool = False):
+        self.ai_client = _shared_ai_client()
+        self.resume = resume  # Skip doctors that already have results saved today in this mode
+        self.skipped_doctors = set()  # Doctors skipped by resume, so callers don't report them as failures
         self.use_embeddings = use_embeddings
         self.embeddings_loader = EmbeddingsLoader() if use_embeddings else None
         self.max_workers = max_workers or PARALLEL_WORKERS
         self.questions_file = questions_file
         self.test_session_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")  # Shared timestamp for this test session
+        self.answer_cache = (AnswerCache(ANSWER_CACHE_FILE, ANSWER_CACHE_TTL_SECS, ANSWER_CACHE_MAX_ENTRIES)
+                             if ANSWER_CACHE_ENABLED else None)
         
         if use_embeddings and self.embeddings_loader:
             print("🧠 Enhanced mode: Using medical code embeddings for additional context")
@@ -129,24 +236,41 @@ class MedicalBoardTest:
             print("📝 Standard mode: Running without embeddings")
     
     def load_questions(self, questions_file: str = "../00_question_banks/final_questions.json") -> List[Dict]:
-        """Load questions from JSON file"""
-        with open(questions_file, 'r') as f:
-            return json.load(f)
+        """Load questions from JSON file (parsed once and shared while the file is unchanged)"""
+        return _load_json_file(questions_file)
     
     def load_answers(self, answers_file: str = "../00_question_banks/final_answers.json") -> Dict:
-        """Load correct answers from JSON file and create lookup dictionary"""
-        with open(answers_file, 'r') as f:
-            answers_list = json.load(f)
-        
-        # Convert list to dictionary for quick lookup
-        answers_dict = {}
-        for answer_item in answers_list:
-            question_number = answer_item.get('question_number')
-            correct_answer = answer_item.get('correct_answer')
-            if question_number and correct_answer:
-                answers_dict[question_number] = correct_answer
-        
-        return answers_dict
+        """Load correct answers from JSON file as a lookup dictionary (built once and shared while the file is unchanged)"""
+        stat = os.stat(answers_file)
+        return _load_answers_cached(answers_file, (stat.st_mtime_ns, stat.st_size))
+    
+    def _ask_model(self, model_id: str, system_prompt: str, question: str,
+                   choices: Dict[str, str]) -> Tuple[Optional[str], Optional[str], Optional[str], float]:
+        """Ask the AI client, reusing a cached answer to the identical prompt when the cache is enabled
+        
+        Returns (selected_choice, reasoning, raw_response, response_time); a cached answer replays the
+        response time of the original API call, so timing stats only ever reflect real model latency
+        """
+        cached = None
+        if self.answer_cache is not None:
+            cache_key = AnswerCache.make_key(model_id, system_prompt, question, choices)
+            cached = self.answer_cache.get(cache_key)
+        
+        if cached is not None:
+            selected_choice, reasoning, raw_response, response_time = cached
+        else:
+            start_time = time.perf_counter()
+            selected_choice, reasoning, raw_response = self.ai_client.ask_question(model_id, system_prompt, question, choices)
+            response_time = time.perf_counter() - start_time
+            if self.answer_cache is not None and selected_choice:  # Only answered questions are worth replaying
+                self.answer_cache.put(cache_key, selected_choice, reasoning, raw_response, response_time)
+        
+        # Answered questions keep only the head of the raw response, since the choice and reasoning are
+        # already stored; unparsed responses are kept whole for debugging
+        if (selected_choice and raw_response and RAW_RESPONSE_MAX_CHARS
+                and len(raw_response) > RAW_RESPONSE_MAX_CHARS):
+            raw_response = raw_response[:RAW_RESPONSE_MAX_CHARS] + "…[truncated]"
+        return selected_choice, reasoning, raw_response, response_time
     
     def _ask_single_question(self, model_id: str, system_prompt: str, question_data: Dict, 
                            correct_answer: str) -> TestResult:
@@ -163,21 +287,19 @@ class MedicalBoardTest:
             if embeddings_context:
                 enhanced_question = question + embeddings_context
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         success = True
         error_message = None
         
         try:
-            selected_choice, reasoning, raw_response = self.ai_client.ask_question(
+            selected_choice, reasoning, raw_response, response_time = self._ask_model(
                 model_id, system_prompt, enhanced_question, choices
             )
         except Exception as e:
             success = False
             error_message = str(e)
             selected_choice, reasoning, raw_response = None, f"Error: {e}", None
-            
-        end_time = datetime.now()
-        response_time = (end_time - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
         
         return TestResult(
             question_number=question_number,
@@ -194,58 +316,56 @@ class MedicalBoardTest:
         )
     
     async def _ask_single_question_async(self, model_id: str, system_prompt: str, question_data: Dict, 
-                                       correct_answer: str, semaphore: asyncio.Semaphore) -> TestResult:
+                                       correct_answer: str, rate_limiter: TokenBucket) -> TestResult:
         """Ask a single question to an AI model (async version with rate limiting)"""
-        async with semaphore:  # Limit concurrent requests
-            # Add small delay for rate limiting
-            await asyncio.sleep(RATE_LIMIT_DELAY)
-            
-            question_number = question_data.get('question_number', 0)
-            question = question_data.get('question', '')
-            choices = question_data.get('choices', {})
-            question_type = question_data.get('question_type', 'other')
-            
-            # Add embeddings context if enabled
-            enhanced_question = question
-            if self.use_embeddings and self.embeddings_loader:
-                embeddings_context = self.embeddings_loader.format_embeddings_context(question_number)
-                if embeddings_context:
-                    enhanced_question = question + embeddings_context
-            
-            # Run the synchronous AI client call in a thread pool
-            loop = asyncio.get_event_loop()
-            
-            start_time = datetime.now()
-            success = True
-            error_message = None
-            
-            try:
-                selected_choice, reasoning, raw_response = await loop.run_in_executor(
-                    None,
-                    lambda: self.ai_client.ask_question(model_id, system_prompt, enhanced_question, choices)
-                )
-            except Exception as e:
-                print(f"   ❌ Error on question {question_number}: {e}")
-                success = False
-                error_message = str(e)
-                selected_choice, reasoning, raw_response = None, f"Error: {e}", None
-            
-            end_time = datetime.now()
-            response_time = (end_time - start_time).total_seconds()
-            
-            return TestResult(
-                question_number=question_number,
-                question=question,
-                question_type=question_type,
-                choices=choices,
-                correct_answer=correct_answer,
-                selected_answer=selected_choice,
-                reasoning=reasoning,
-                response_time=response_time,
-                raw_response=raw_response,
-                success=success,
-                error_message=error_message
+        # Wait for the model's request budget, plus a little jitter so requests don't go out in lockstep
+        await rate_limiter.acquire()
+        await asyncio.sleep(random.uniform(0, RATE_LIMIT_DELAY * 0.2))
+        
+        question_number = question_data.get('question_number', 0)
+        question = question_data.get('question', '')
+        choices = question_data.get('choices', {})
+        question_type = question_data.get('question_type', 'other')
+        
+        # Add embeddings context if enabled
+        enhanced_question = question
+        if self.use_embeddings and self.embeddings_loader:
+            embeddings_context = self.embeddings_loader.format_embeddings_context(question_number)
+            if embeddings_context:
+                enhanced_question = question + embeddings_context
+        
+        # Run the synchronous AI client call on the shared request thread pool
+        loop = asyncio.get_running_loop()
+        
+        start_time = time.perf_counter()
+        success = True
+        error_message = None
+        
+        try:
+            selected_choice, reasoning, raw_response, response_time = await loop.run_in_executor(
+                _shared_request_executor(self.max_workers), self._ask_model,
+                model_id, system_prompt, enhanced_question, choices
             )
+        except Exception as e:
+            print(f"   ❌ Error on question {question_number}: {e}")
+            success = False
+            error_message = str(e)
+            selected_choice, reasoning, raw_response = None, f"Error: {e}", None
+            response_time = time.perf_counter() - start_time
+        
+        return TestResult(
+            question_number=question_number,
+            question=question,
+            question_type=question_type,
+            choices=choices,
+            correct_answer=correct_answer,
+            selected_answer=selected_choice,
+            reasoning=reasoning,
+            response_time=response_time,
+            raw_response=raw_response,
+            success=success,
+            error_message=error_message
+        )
     
     async def _process_questions_parallel(self, model_id: str, questions: List[Dict], 
                                         answers: Dict, max_workers: int = None) -> List[TestResult]:
@@ -253,11 +373,11 @@ class MedicalBoardTest:
         if max_workers is None:
             max_workers = self.max_workers
         
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_workers)
+        # Pace requests with a per-model token bucket (one per run, since it binds to this event loop)
+        rate_limiter = TokenBucket(MODEL_REQUESTS_PER_SECOND, MODEL_REQUEST_BURST)
         
-        # Create tasks for all questions
-        tasks = []
+        # Collect the questions to ask
+        jobs = []
         for question_data in questions:
             question_number = question_data.get('question_number', 0)
             question_type = question_data.get('question_type', 'other')
@@ -269,29 +389,67 @@ class MedicalBoardTest:
                 continue
             
             # Get system prompt based on question type
-            system_prompt = SYSTEM_PROMPTS.get(question_type, SYSTEM_PROMPTS['other'])
-            
-            # Create async task
-            task = self._ask_single_question_async(model_id, system_prompt, question_data, correct_answer, semaphore)
-            tasks.append(task)
+            system_prompt = SYSTEM_PROMPTS.get(question_type, DEFAULT_SYSTEM_PROMPT)
+            jobs.append((system_prompt, question_data, correct_answer))
         
-        # Process all questions in parallel
-        print(f"   🚀 Processing {len(tasks)} questions in parallel (max {max_workers} concurrent)")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # A fixed set of workers pulls from the shared job iterator, so only max_workers questions
+        # are ever in flight instead of one pending task per question
+        results = [None] * len(jobs)
+        pending_jobs = iter(enumerate(jobs))
         
-        # Filter out exceptions and return valid results
-        valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                print(f"   ❌ Task {i+1} failed: {result}")
-            else:
-                valid_results.append(result)
+        async def worker():
+            for i, (system_prompt, question_data, correct_answer) in pending_jobs:
+                try:
+                    results[i] = await self._ask_single_question_async(
+                        model_id, system_prompt, question_data, correct_answer, rate_limiter
+                    )
+                except Exception as e:
+                    print(f"   ❌ Task {i+1} failed: {e}")
         
-        return valid_results
+        print(f"   🚀 Processing {len(jobs)} questions in parallel (max {max_workers} concurrent)")
+        await asyncio.gather(*(worker() for _ in range(min(max_workers, len(jobs)))))
+        
+        # Drop questions whose task failed, keeping question order
+        return [result for result in results if result is not None]
+    
+    def _result_file_stem(self, doctor_name: str) -> str:
+        """Filename prefix of a doctor's results file in this mode"""
+        doctor_key = doctor_name.lower().replace(" ", "_").replace("dr._", "").replace(".", "_").replace("(", "").replace(")", "").replace("the_", "")
+        mode_suffix = "_enhanced" if self.use_embeddings else ""
+        return f"{doctor_key}{mode_suffix}"
+    
+    def _skip_doctors_tested_today(self, doctor_keys: List[str]) -> List[str]:
+        """When resuming, drop doctors whose results for this mode were already saved today"""
+        if not self.resume or not os.path.isdir(RESULTS_DIR):
+            return doctor_keys
+        
+        # Go by each results file's own save date, so a session folder started before midnight still counts
+        today = f"{datetime.now():%Y%m%d}"
+        saved_today = set()
+        with os.scandir(RESULTS_DIR) as folders:
+            for folder in folders:
+                if folder.name.startswith("test_") and folder.is_dir():
+                    with os.scandir(folder.path) as files:
+                        for entry in files:
+                            match = RESULT_FILE_PATTERN.fullmatch(entry.name)
+                            if match and match.group(2) == today:
+                                saved_today.add(match.group(1))
+        
+        remaining = []
+        for doctor_key in doctor_keys:
+            doctor_config = AI_DOCTORS.get(doctor_key)
+            if doctor_config and self._result_file_stem(doctor_config["display_name"]) in saved_today:
+                print(f"⏭  Skipping {doctor_key} (already tested today)")
+                self.skipped_doctors.add(doctor_key)
+                continue
+            remaining.append(doctor_key)
+        return remaining
     
     def run_single_doctor_test(self, doctor_key: str, max_questions: Optional[int] = None, 
                              parallel: bool = True) -> Optional[DoctorTestResults]:
         """Run test for a single doctor (wrapper for async version)"""
+        if not self._skip_doctors_tested_today([doctor_key]):
+            return None
         if parallel:
             return asyncio.run(self.run_single_doctor_test_async(doctor_key, max_questions))
         else:
@@ -320,24 +478,17 @@ class MedicalBoardTest:
         results = DoctorTestResults(doctor_name, model_id)
         results.total_questions = len(questions)
         
-        # Process questions in parallel
-        start_time = time.time()
+        # Process questions in parallel; the shared request thread pool outlives this event loop, so
+        # doctors tested one after another reuse the same threads instead of a fresh pool each
+        start_time = time.perf_counter()
         test_results = await self._process_questions_parallel(model_id, questions, answers)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Process results
-        total_response_time = 0.0
-        completed_count = 0
-        
-        for test_result in test_results:
-            results.results.append(test_result)
-            total_response_time += test_result.response_time
-            
-            if test_result.selected_answer:
-                completed_count += 1
-        
+        results.results.extend(test_results)
+        completed_count = sum(1 for test_result in test_results if test_result.selected_answer)
         results.completed_answers = completed_count
-        results.total_response_time = total_response_time
+        results.total_response_time = sum(test_result.response_time for test_result in test_results)
         
         # Print summary
         processing_time = end_time - start_time
@@ -354,10 +505,18 @@ class MedicalBoardTest:
         return results
     
     async def run_multiple_doctors_async(self, doctor_keys: List[str], max_questions: Optional[int] = None,
-                                       max_concurrent_agents: int = DEFAULT_MAX_CONCURRENT_AGENTS) -> List[DoctorTestResults]:
+                                       max_concurrent_agents: int = DEFAULT_MAX_CONCURRENT_AGENTS,
+                                       parallel_questions: bool = True) -> List[DoctorTestResults]:
         """Run tests for multiple doctors in parallel"""
         print(f"🚀 Running parallel tests for {len(doctor_keys)} agents (max {max_concurrent_agents} concurrent)")
         
+        # Each in-flight question runs its blocking API call on the request thread pool. Size it for
+        # every concurrent agent's workers, otherwise the pool quietly caps how many requests are
+        # really in flight across agents
+        request_threads = max_concurrent_agents * self.max_workers
+        _shared_request_executor(request_threads)
+        loop = asyncio.get_running_loop()
+        
         # Create semaphore to limit concurrent agents
         agent_semaphore = asyncio.Semaphore(max_concurrent_agents)
         
@@ -365,7 +524,14 @@ class MedicalBoardTest:
             """Run a single agent test with semaphore control"""
             async with agent_semaphore:
                 try:
-                    return await self.run_single_doctor_test_async(doctor_key, max_questions)
+                    if parallel_questions:
+                        return await self.run_single_doctor_test_async(doctor_key, max_questions)
+                    # Sequential question mode still overlaps agents: each one asks its questions
+                    # in order on its own thread
+                    return await loop.run_in_executor(
+                        _shared_request_executor(request_threads), self._run_single_doctor_test_sequential,
+                        doctor_key, max_questions
+                    )
                 except Exception as e:
                     print(f"❌ Error testing {doctor_key}: {e}")
                     return None
@@ -375,11 +541,11 @@ class MedicalBoardTest:
         
         # Run all agent tests in parallel with progress tracking
         print(f"⏳ Processing {len(tasks)} agents in parallel...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         total_time = end_time - start_time
         
         # Process results and filter out failures
@@ -407,10 +573,11 @@ class MedicalBoardTest:
                            max_concurrent_agents: int = DEFAULT_MAX_CONCURRENT_AGENTS,
                            parallel: bool = True) -> List[DoctorTestResults]:
         """Run tests for multiple doctors (wrapper for async version)"""
-        if parallel and len(doctor_keys) > 1:
-            return asyncio.run(self.run_multiple_doctors_async(doctor_keys, max_questions, max_concurrent_agents))
+        doctor_keys = self._skip_doctors_tested_today(doctor_keys)
+        if len(doctor_keys) > 1:
+            return asyncio.run(self.run_multiple_doctors_async(doctor_keys, max_questions, max_concurrent_agents, parallel))
         else:
-            # Sequential fallback
+            # Single doctor: nothing to overlap
             results = []
             for doctor_key in doctor_keys:
                 try:
@@ -447,27 +614,28 @@ class MedicalBoardTest:
         for i, question_data in enumerate(questions, 1):
             question_number = question_data.get('question_number', i)
             question_type = question_data.get('question_type', 'other')
-            
-            print(f"   Question {i}/{len(questions)}: #{question_number} ({question_type})")
+            progress = f"   Question {i}/{len(questions)}: #{question_number} ({question_type})"
             
             # Get correct answer
             correct_answer = answers.get(question_number)
             if not correct_answer:
-                print(f"   ⚠️  No correct answer found for question {question_number}")
+                sys.stdout.write(f"{progress} ⚠️  No correct answer found for question {question_number}\n")
                 continue
             
             # Get system prompt based on question type
-            system_prompt = SYSTEM_PROMPTS.get(question_type, SYSTEM_PROMPTS['other'])
+            system_prompt = SYSTEM_PROMPTS.get(question_type, DEFAULT_SYSTEM_PROMPT)
             
             # Ask the question
             test_result = self._ask_single_question(model_id, system_prompt, question_data, correct_answer)
             results.results.append(test_result)
             
+            # One write per question: agents can run this loop concurrently, and a single write
+            # keeps each progress line intact
             if test_result.selected_answer:
                 results.completed_answers += 1
-                print(f"   ✍🏻 Answered: {test_result.selected_answer}")
+                sys.stdout.write(f"{progress} ✍🏻 Answered: {test_result.selected_answer}\n")
             else:
-                print(f"   ⚠️  No answer provided")
+                sys.stdout.write(f"{progress} ⚠️  No answer provided\n")
             
             results.total_response_time += test_result.response_time
         
@@ -486,13 +654,9 @@ class MedicalBoardTest:
         test_folder = f"../02_test_attempts/test_{self.test_session_timestamp}"
         os.makedirs(test_folder, exist_ok=True)
         
-        # Generate filename with individual result timestamp
+        # Generate filename with individual result timestamp (stem carries the enhanced-mode suffix)
         individual_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") 
-        doctor_key = results.doctor_name.lower().replace(" ", "_").replace("dr._", "").replace(".", "_").replace("(", "").replace(")", "").replace("the_", "")
-        
-        # Add suffix for enhanced mode
-        mode_suffix = "_enhanced" if self.use_embeddings else ""
-        filename = f"{test_folder}/{doctor_key}{mode_suffix}_{individual_timestamp}.json"
+        filename = f"{test_folder}/{self._result_file_stem(results.doctor_name)}_{individual_timestamp}.json"
         
         # Prepare data for JSON serialization
         results_data = {
@@ -506,25 +670,17 @@ class MedicalBoardTest:
             "average_response_time": results.average_response_time,
             "use_embeddings": self.use_embeddings,
             "embeddings_count": len(self.embeddings_loader.embeddings) if self.embeddings_loader else 0,
-            "results": []
+            # TestResults are converted one at a time as they are written, instead of first
+            # building a full copy of every result (and its raw response) as dicts
+            "results": results.results
         }
         
-        for result in results.results:
-            results_data["results"].append({
-                "question_number": result.question_number,
-                "question": result.question,
-                "question_type": result.question_type,
-                "choices": result.choices,
-                "selected_answer": result.selected_answer,
-                "reasoning": result.reasoning,
-                "response_time": result.response_time,
-                "raw_response": result.raw_response,
-                "success": result.success,
-                "error_message": result.error_message
-            })
-        
-        with open(filename, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        with open(filename, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            if RESULTS_JSON_INDENT is None:
+                # json only uses its C encoder for one-shot, unindented dumps
+                f.write(json.dumps(results_data, default=_test_result_to_json))
+            else:
+                json.dump(results_data, f, indent=RESULTS_JSON_INDENT, default=_test_result_to_json)
         
         print(f"💾 Results saved to {filename}")
 
@@ -554,6 +710,8 @@ def main():
                        help="Test agents sequentially instead of in parallel")
     parser.add_argument("--questions-file", type=str, default="../00_question_banks/final_questions.json",
                        help="Path to custom questions file")
+    parser.add_argument("--resume", action="store_true",
+                       help="Skip doctors that already have results saved today for this mode")
     
     args = parser.parse_args()
     
@@ -587,7 +745,7 @@ def main():
             print("\n" + "="*60)
             print("🧠 ENHANCED MODE (With Embeddings)")
             print("="*60)
-            enhanced_test = MedicalBoardTest(use_embeddings=True, max_workers=args.workers, questions_file=args.questions_file)
+            enhanced_test = MedicalBoardTest(use_embeddings=True, max_workers=args.workers, questions_file=args.questions_file, resume=args.resume)
             
             if parallel_agents:
                 enhanced_results = enhanced_test.run_multiple_doctors(
@@ -621,7 +779,7 @@ def main():
             print("\n" + "="*60)
             print("📝 VANILLA MODE (No Embeddings)")
             print("="*60)
-            vanilla_test = MedicalBoardTest(use_embeddings=False, max_workers=args.workers, questions_file=args.questions_file)
+            vanilla_test = MedicalBoardTest(use_embeddings=False, max_workers=args.workers, questions_file=args.questions_file, resume=args.resume)
             
             if parallel_agents:
                 vanilla_results = vanilla_test.run_multiple_doctors(
@@ -641,7 +799,7 @@ def main():
             print("\n" + "="*60)
             print("🧠 ENHANCED MODE (With Embeddings)")
             print("="*60)
-            enhanced_test = MedicalBoardTest(use_embeddings=True, max_workers=args.workers, questions_file=args.questions_file)
+            enhanced_test = MedicalBoardTest(use_embeddings=True, max_workers=args.workers, questions_file=args.questions_file, resume=args.resume)
             
             if parallel_agents:
                 enhanced_results = enhanced_test.run_multiple_doctors(
@@ -682,12 +840,12 @@ def main():
         return
     
     # Create test runner
-    test = MedicalBoardTest(use_embeddings=args.embeddings, max_workers=args.workers, questions_file=args.questions_file)
+    test = MedicalBoardTest(use_embeddings=args.embeddings, max_workers=args.workers, questions_file=args.questions_file, resume=args.resume)
     
     if args.doctor:
         # Test specific doctor
         result = test.run_single_doctor_test(args.doctor, args.max_questions, parallel_questions)
-        if not result:
+        if not result and args.doctor not in test.skipped_doctors:
             print(f"Failed to test doctor: {args.doctor}")
     else:
         # Test all doctors in the specified mode
@@ -0,0 +1,31 @@
+"""
+Token-bucket rate limiting for async API requests
+"""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Allows up to `burst` requests at once, refilled at `rate_per_sec` requests per second"""
+    
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()  # Binds to the first event loop that uses it, so use one bucket per run
+    
+    async def acquire(self):
+        """Wait until a request token is available, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate_per_sec)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                # Sleep just long enough for the next token to accrue
+                await asyncio.sleep((1 - self.tokens) / self.rate_per_sec)
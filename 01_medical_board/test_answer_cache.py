@@ -0,0 +1,61 @@
+"""
+Tests for replaying cached answers with their original response time
+Run from this directory: python -m unittest test_answer_cache
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import medical_test
+from answer_cache import AnswerCache
+
+
+class AnswerCacheTest(unittest.TestCase):
+    """Check that cached answers keep the API latency they were recorded with"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.db_path = os.path.join(self.tmp_dir.name, "answers.sqlite3")
+    
+    def test_replays_original_response_time(self):
+        cache = AnswerCache(self.db_path)
+        cache.put("key", "B", "because", "{}", 2.5)
+        
+        self.assertEqual(cache.get("key"), ("B", "because", "{}", 2.5))
+    
+    def test_rows_without_response_time_are_misses(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE answers (key TEXT PRIMARY KEY, selected TEXT, reasoning TEXT, raw TEXT, ts INTEGER)")
+        conn.execute("INSERT INTO answers VALUES ('key', 'B', 'because', '{}', strftime('%s', 'now'))")
+        conn.commit()
+        conn.close()
+        
+        cache = AnswerCache(self.db_path)
+        self.assertIsNone(cache.get("key"))
+        
+        cache.put("key", "C", "later", "{}", 1.0)
+        self.assertEqual(cache.get("key"), ("C", "later", "{}", 1.0))
+    
+    def test_cache_hit_reports_original_response_time(self):
+        with mock.patch("builtins.print"):
+            test = medical_test.MedicalBoardTest()
+        test.answer_cache = AnswerCache(self.db_path)
+        choices = {"A": "a", "B": "b", "C": "c", "D": "d"}
+        
+        with mock.patch.object(test.ai_client, "ask_question", return_value=("B", "because", "{}")), \
+                mock.patch.object(medical_test.time, "perf_counter", side_effect=[10.0, 13.0]):
+            first = test._ask_model("model", "system", "question", choices)
+        
+        with mock.patch.object(test.ai_client, "ask_question") as ask_question:
+            replayed = test._ask_model("model", "system", "question", choices)
+        
+        ask_question.assert_not_called()
+        self.assertEqual(first, ("B", "because", "{}", 3.0))
+        self.assertEqual(replayed, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the request thread pool shared by every MedicalBoardTest
+Run from this directory: python -m unittest test_request_executor
+"""
+import asyncio
+import unittest
+from unittest import mock
+
+import medical_test
+from rate_limit import TokenBucket
+
+
+class SharedRequestExecutorTest(unittest.TestCase):
+    """Check that growing the shared pool never strands another test instance"""
+    
+    def setUp(self):
+        patcher = mock.patch.multiple(medical_test, _request_executor=None, _request_executor_size=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _make_test(self, max_workers: int) -> medical_test.MedicalBoardTest:
+        with mock.patch("builtins.print"):
+            return medical_test.MedicalBoardTest(max_workers=max_workers)
+    
+    def test_grows_only_when_more_threads_are_needed(self):
+        small = medical_test._shared_request_executor(2)
+        self.assertIs(medical_test._shared_request_executor(1), small)
+        
+        larger = medical_test._shared_request_executor(8)
+        self.assertIsNot(larger, small)
+        self.assertIs(medical_test._shared_request_executor(2), larger)
+    
+    def test_instance_keeps_working_after_another_grows_the_pool(self):
+        small_test = self._make_test(max_workers=2)
+        medical_test._shared_request_executor(2)
+        
+        # A second instance (e.g. the enhanced run of --all) needs a bigger pool
+        medical_test._shared_request_executor(16)
+        
+        question = {"question_number": 1, "question": "Q?", "choices": {"A": "a", "B": "b"}}
+        with mock.patch.object(small_test.ai_client, "ask_question", return_value=("A", "because", "{}")), \
+                mock.patch.object(medical_test, "RATE_LIMIT_DELAY", 0):
+            result = asyncio.run(small_test._ask_single_question_async(
+                "model", "system", question, "A", TokenBucket(100, 100)
+            ))
+        
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(result.selected_answer, "A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for --resume skipping doctors that were already tested today
+Run from this directory: python -m unittest test_resume
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import medical_test
+from config import AI_DOCTORS
+
+
+class ResumeSkipTest(unittest.TestCase):
+    """Check which doctors _skip_doctors_tested_today drops"""
+    
+    def setUp(self):
+        self.results_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(medical_test, "RESULTS_DIR", self.results_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.results_dir.cleanup)
+        
+        self.doctor_keys = list(AI_DOCTORS.keys())[:2]
+        self.today = datetime.now()
+        self.yesterday = self.today - timedelta(days=1)
+    
+    def _make_test(self, use_embeddings: bool = False, resume: bool = True) -> medical_test.MedicalBoardTest:
+        with mock.patch("builtins.print"):
+            return medical_test.MedicalBoardTest(use_embeddings=use_embeddings, resume=resume)
+    
+    def _save_result_file(self, test: medical_test.MedicalBoardTest, doctor_key: str,
+                          session_time: datetime, saved_time: datetime):
+        folder = os.path.join(self.results_dir.name, f"test_{session_time:%Y%m%d_%H%M%S}")
+        os.makedirs(folder, exist_ok=True)
+        stem = test._result_file_stem(AI_DOCTORS[doctor_key]["display_name"])
+        with open(os.path.join(folder, f"{stem}_{saved_time:%Y%m%d_%H%M%S}.json"), "w") as f:
+            f.write("{}")
+    
+    def _skip(self, test: medical_test.MedicalBoardTest):
+        with mock.patch("builtins.print"):
+            return test._skip_doctors_tested_today(self.doctor_keys)
+    
+    def test_skips_doctor_saved_today(self):
+        test = self._make_test()
+        self._save_result_file(test, self.doctor_keys[0], self.today, self.today)
+        
+        self.assertEqual(self._skip(test), self.doctor_keys[1:])
+        self.assertEqual(test.skipped_doctors, {self.doctor_keys[0]})
+    
+    def test_skips_file_saved_today_in_session_started_yesterday(self):
+        test = self._make_test()
+        self._save_result_file(test, self.doctor_keys[0], self.yesterday, self.today)
+        
+        self.assertEqual(self._skip(test), self.doctor_keys[1:])
+    
+    def test_keeps_doctor_saved_yesterday(self):
+        test = self._make_test()
+        self._save_result_file(test, self.doctor_keys[0], self.yesterday, self.yesterday)
+        
+        self.assertEqual(self._skip(test), self.doctor_keys)
+        self.assertEqual(test.skipped_doctors, set())
+    
+    def test_modes_are_tracked_separately(self):
+        vanilla_test = self._make_test(use_embeddings=False)
+        self._save_result_file(vanilla_test, self.doctor_keys[0], self.today, self.today)
+        
+        enhanced_test = self._make_test(use_embeddings=True)
+        self.assertEqual(self._skip(enhanced_test), self.doctor_keys)
+    
+    def test_without_resume_nothing_is_skipped(self):
+        test = self._make_test(resume=False)
+        self._save_result_file(test, self.doctor_keys[0], self.today, self.today)
+        
+        self.assertEqual(self._skip(test), self.doctor_keys)
+    
+    def test_skipped_single_doctor_returns_none_without_running(self):
+        test = self._make_test()
+        self._save_result_file(test, self.doctor_keys[0], self.today, self.today)
+        
+        with mock.patch.object(test, "_run_single_doctor_test_sequential") as run_sequential, \
+                mock.patch("builtins.print"):
+            result = test.run_single_doctor_test(self.doctor_keys[0], parallel=False)
+        
+        self.assertIsNone(result)
+        run_sequential.assert_not_called()
+        self.assertIn(self.doctor_keys[0], test.skipped_doctors)
+
+
+if __name__ == "__main__":
+    unittest.main()
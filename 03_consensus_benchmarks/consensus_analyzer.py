@@ -14,13 +14,22 @@ import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from collections import Counter, defaultdict
+from itertools import groupby
+from operator import itemgetter
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 # Add medical_board to path for direct imports
 sys.path.append("../01_medical_board")
 from medical_test import MedicalBoardTest
 
-@dataclass
+# Max threads used to read per-doctor result files
+MAX_LOAD_WORKERS = 8
+
+# Buffer size for writing reports, so json.dump's many small chunks coalesce into few writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+@dataclass(slots=True, frozen=True)
 class QuestionConsensus:
     """Consensus result for a single question"""
     question_number: int
@@ -69,6 +78,11 @@ class ConsensusAnalyzer:
         with open(self.questions_file, 'r', encoding='utf-8') as f:
             return json.load(f)
     
+    def _load_result_file(self, file_path: str) -> Dict:
+        """Read a result file as raw bytes and parse it; json.loads detects the UTF encoding itself"""
+        with open(file_path, 'rb') as f:
+            return json.loads(f.read())
+    
     def load_test_results(self, test_folder: str) -> List[Dict]:
         """Load test results from a specific test folder"""
         test_path = os.path.join(self.results_dir, test_folder)
@@ -77,12 +91,21 @@ class ConsensusAnalyzer:
             return []
         
         results = []
-        for filename in os.listdir(test_path):
-            if filename.endswith('.json'):
-                file_path = os.path.join(test_path, filename)
+        with os.scandir(test_path) as entries:
+            result_files = [(entry.name, entry.path) for entry in entries
+                            if entry.name.endswith('.json') and entry.is_file()]
+        if not result_files:
+            return results
+        
+        # Files are independent, so read and parse them concurrently; results are
+        # consumed in listing order so warnings and output stay deterministic
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(result_files))) as executor:
+            futures = [(filename, file_path, executor.submit(self._load_result_file, file_path))
+                       for filename, file_path in result_files]
+            
+            for filename, file_path, future in futures:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = future.result()
                     
                     # Filter by mode if needed
                     is_enhanced = data.get("use_embeddings", False) or "_enhanced_" in filename
@@ -194,80 +217,60 @@ class ConsensusAnalyzer:
             print(f"❌ No results found in {test_folder}")
             return []
         
-        print(f"\n📊 Analyzing results from {len(results)} AI models:")
+        lines = [f"\n📊 Analyzing results from {len(results)} AI models:"]
         for result in results:
             doctor_name = result.get("doctor_name", "Unknown")
             is_enhanced = result.get("use_embeddings", False)
             mode_suffix = " (Enhanced)" if is_enhanced else " (Vanilla)"
-            print(f"   • {doctor_name}{mode_suffix}")
+            lines.append(f"   • {doctor_name}{mode_suffix}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Determine threshold
         threshold = self.threshold_first if round_num == 1 else self.threshold_subsequent
-        print(f"📏 Using {threshold * 100:.0f}% consensus threshold for round {round_num}")
-        
-        # Group responses by question number
-        question_responses = defaultdict(list)
-        
-        for test_session in results:
-            doctor_name = test_session["doctor_name"]
-            
-            for result in test_session.get("results", []):
-                question_num = result["question_number"]
-                
-                if result["selected_answer"]:
-                    # Clean the question text (remove previous context if any)
-                    clean_question = result["question"].split("\n\n--- Previous Vote Results ---")[0]
-                    
-                    question_responses[question_num].append({
-                        "doctor": doctor_name,
-                        "answer": result["selected_answer"],
-                        "reasoning": result.get("reasoning", ""),
-                        "question": clean_question,
-                        "question_type": result.get("question_type", "other"),
-                        "choices": result["choices"]
-                    })
+        threshold_percentage = threshold * 100
+        print(f"📏 Using {threshold_percentage:.0f}% consensus threshold for round {round_num}")
+        
+        # Collect every answered response as a flat row, then sort once by question number so
+        # each question's votes form one contiguous group (the sort is stable, keeping doctor order)
+        answered = [
+            (result["question_number"], result["selected_answer"], test_session["doctor_name"], result)
+            for test_session in results
+            for result in test_session.get("results", [])
+            if result["selected_answer"]
+        ]
+        answered.sort(key=itemgetter(0))
         
         # Analyze consensus
         consensus_results = []
         
-        for question_num in sorted(question_responses.keys()):
-            responses = question_responses[question_num]
-            
-            if not responses:
-                continue
-            
-            # Count votes
-            vote_counts = Counter()
-            votes_by_choice = defaultdict(list)
-            
-            for response in responses:
-                choice = response["answer"]
-                doctor = response["doctor"]
-                vote_counts[choice] += 1
-                votes_by_choice[choice].append(doctor)
+        for question_num, group in groupby(answered, key=itemgetter(0)):
+            rows = list(group)
+            first_result = rows[0][3]
+            total_votes = len(rows)
             
-            total_votes = len(responses)
+            # The only per-row work is appending the voter; counts fall out of the list lengths
+            votes_by_choice = {}
+            for _, choice, doctor_name, _ in rows:
+                votes_by_choice.setdefault(choice, []).append(doctor_name)
+            vote_counts = {choice: len(doctors) for choice, doctors in votes_by_choice.items()}
             
             # Find consensus
-            if vote_counts:
-                consensus_choice = vote_counts.most_common(1)[0][0]
-                consensus_count = vote_counts[consensus_choice]
-                consensus_percentage = (consensus_count / total_votes) * 100
-                consensus_achieved = consensus_percentage >= (threshold * 100)
-            else:
-                consensus_choice = None
-                consensus_percentage = 0.0
-                consensus_achieved = False
+            # First choice to reach the top count wins ties, as most_common did
+            consensus_choice = max(vote_counts, key=vote_counts.__getitem__)
+            consensus_count = vote_counts[consensus_choice]
+            consensus_percentage = (consensus_count / total_votes) * 100
+            consensus_achieved = consensus_percentage >= threshold_percentage
             
             # Create consensus result
-            first_response = responses[0]
+            # Clean the question text (remove previous context if any)
+            clean_question = first_result["question"].split("\n\n--- Previous Vote Results ---")[0]
             consensus_result = QuestionConsensus(
                 question_number=question_num,
-                question=first_response["question"],
-                question_type=first_response["question_type"],
-                choices=first_response["choices"],
-                votes=dict(votes_by_choice),
-                vote_counts=dict(vote_counts),
+                question=clean_question,
+                question_type=first_result.get("question_type", "other"),
+                choices=first_result["choices"],
+                votes=votes_by_choice,
+                vote_counts=vote_counts,
                 total_votes=total_votes,
                 consensus_choice=consensus_choice,
                 consensus_percentage=consensus_percentage,
@@ -294,12 +297,13 @@ class ConsensusAnalyzer:
     def save_vote_report(self, results: List[QuestionConsensus], round_num: int, 
                         vote_history: Dict[int, List[Dict]]) -> str:
         """Save vote-specific report with all questions"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"consensus_report_vote_{round_num:02d}_{timestamp}.json"
         filepath = os.path.join(self.consensus_reports_dir, filename)
         
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "vote_round": round_num,
             "mode": self.mode,
             "summary": {
@@ -328,7 +332,7 @@ class ConsensusAnalyzer:
             }
             report["questions"].append(question_data)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
         
         print(f"💾 Vote report saved: {filename}")
@@ -346,10 +350,7 @@ class ConsensusAnalyzer:
         results_map = {r.question_number: r for r in all_results}
         
         # Calculate statistics
-        questions_by_rounds = defaultdict(int)
-        for q_num, history in vote_history.items():
-            rounds_needed = len(history)
-            questions_by_rounds[rounds_needed] += 1
+        questions_by_rounds = Counter(len(history) for history in vote_history.values())
         
         report = {
             "timestamp": datetime.now().isoformat(),
@@ -379,10 +380,9 @@ class ConsensusAnalyzer:
             }
             report["questions"].append(question_data)
         
-        # Sort questions by question number
-        report["questions"].sort(key=lambda x: x["question_number"])
+        # No re-sort needed: all_results is already ordered by question number
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Final consensus report saved with {len(report['questions'])} tested questions: {filepath}")
@@ -441,7 +441,7 @@ class ConsensusAnalyzer:
         
         # Check status and continue rounds if needed
         while round_num < self.max_rounds:
-            # Find questions that still need consensus
+            # Find questions that still need consensus (all_results is kept sorted by question number)
             failed_questions = [r.question_number for r in all_results if not r.consensus_achieved]
             
             # Print round summary
@@ -454,9 +454,9 @@ class ConsensusAnalyzer:
             
             print(f"❌ {len(failed_questions)} questions need another round")
             if len(failed_questions) <= 20:
-                print(f"   Questions: {', '.join(map(str, sorted(failed_questions)))}")
+                print(f"   Questions: {', '.join(map(str, failed_questions))}")
             else:
-                print(f"   Questions: {', '.join(map(str, sorted(failed_questions[:10])))}, ... and {len(failed_questions)-10} more")
+                print(f"   Questions: {', '.join(map(str, failed_questions[:10]))}, ... and {len(failed_questions)-10} more")
             
             # Ask user if they want to continue (unless auto_continue is enabled)
             if round_num < self.max_rounds:
@@ -512,23 +512,24 @@ class ConsensusAnalyzer:
         # Save final report
         self.save_final_report(all_results, round_num, dict(vote_history))
         
-        # Print final summary
-        print(f"\n{'='*60}")
-        print(f"🏁 CONSENSUS ANALYSIS COMPLETE")
-        print(f"{'='*60}")
+        # Print final summary as a single write
         final_consensus = sum(1 for r in all_results if r.consensus_achieved)
-        print(f"Total Questions: {len(all_results)}")
-        print(f"Consensus Achieved: {final_consensus}/{len(all_results)} ({final_consensus/len(all_results)*100:.1f}%)")
-        print(f"Total Rounds: {round_num}")
+        out = [
+            f"\n{'='*60}",
+            f"🏁 CONSENSUS ANALYSIS COMPLETE",
+            f"{'='*60}",
+            f"Total Questions: {len(all_results)}",
+            f"Consensus Achieved: {final_consensus}/{len(all_results)} ({final_consensus/len(all_results)*100:.1f}%)",
+            f"Total Rounds: {round_num}",
+        ]
         
         # Show distribution of rounds needed
-        rounds_distribution = defaultdict(int)
-        for history in vote_history.values():
-            rounds_distribution[len(history)] += 1
+        rounds_distribution = Counter(len(history) for history in vote_history.values())
         
-        print(f"\nRounds needed per question:")
-        for rounds, count in sorted(rounds_distribution.items()):
-            print(f"  {rounds} round{'s' if rounds > 1 else ''}: {count} questions")
+        out.append(f"\nRounds needed per question:")
+        out.extend(f"  {rounds} round{'s' if rounds > 1 else ''}: {count} questions"
+                   for rounds, count in sorted(rounds_distribution.items()))
+        sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main entry point"""
@@ -8,12 +8,35 @@ to determine how accurate the AI consensus is compared to the ground truth.
 
 import json
 import os
-import glob
+import re
+import sys
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter, defaultdict
+from pathlib import Path
 
-@dataclass
+# Per-model result filenames: "<model_name>_<YYYYMMDD>_<HHMMSS>.json", excluding report files
+RESULT_FILENAME_PATTERN = re.compile(r'^(?!consensus_report|validation_report)(.+?)_(\d{8}_\d{6})\.json$')
+
+# Buffer size for writing reports, so json.dump's many small chunks coalesce into few writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of example questions listed in the validation summary
+MAX_INCORRECT_SHOWN = 10
+MAX_NO_CONSENSUS_SHOWN = 5
+
+# Answer choices in display order
+ANSWER_CHOICES = "ABCDE"
+
+# Self-correction bucket for each (first round correct, last round correct) pair
+VOTE_TRANSITIONS = {
+    (True, True): "stayed_right",
+    (False, True): "corrected_to_right",
+    (True, False): "corrected_to_wrong",
+    (False, False): "stayed_wrong",
+}
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating consensus against answer key"""
     question_number: int
@@ -25,6 +48,25 @@ class ValidationResult:
     is_consensus_correct: bool
     total_votes: int
     vote_breakdown: Dict[str, int]
+    leading_choice: Optional[str]  # Choice with the most votes, if any votes were cast
+    correct_votes: int  # Votes cast for the correct answer
+    vote_history: List[Dict]  # Per-round votes from the consensus report
+
+def _result_to_json(obj):
+    """Convert a ValidationResult into its report entry while the report is being written"""
+    if isinstance(obj, ValidationResult):
+        return {
+            "question_number": obj.question_number,
+            "question_type": obj.question_type,
+            "correct_answer": obj.correct_answer,
+            "consensus_choice": obj.consensus_choice,
+            "consensus_achieved": obj.consensus_achieved,
+            "consensus_percentage": obj.consensus_percentage,
+            "is_consensus_correct": obj.is_consensus_correct,
+            "total_votes": obj.total_votes,
+            "vote_breakdown": obj.vote_breakdown
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 class ConsensusValidator:
     """Validates consensus results against the official answer key"""
@@ -33,18 +75,26 @@ class ConsensusValidator:
         self.answer_key_file = "../00_question_banks/final_answers.json"
         self.consensus_reports_dir = "../03_consensus_benchmarks/consensus_reports"
         self.questions_file = "../00_question_banks/final_questions.json"
+        self.test_attempts_dir = "../02_test_attempts"
+        # Parsed answer key and question types, loaded on first use
+        self._answer_key: Optional[Dict[int, str]] = None
+        self._question_types: Optional[Dict[int, str]] = None
+    
+    def _load_json(self, filepath: str):
+        """Read a JSON file as raw bytes and parse it in one step"""
+        return json.loads(Path(filepath).read_bytes())
     
     def load_answer_key(self) -> Dict[int, str]:
-        """Load the official answer key"""
+        """Load the official answer key (cached after the first successful load)"""
+        if self._answer_key is not None:
+            return self._answer_key
+        
         try:
-            with open(self.answer_key_file, 'r', encoding='utf-8') as f:
-                answers = json.load(f)
-            
-            answer_key = {}
-            for item in answers:
-                answer_key[item["question_number"]] = item["correct_answer"]
+            answers = self._load_json(self.answer_key_file)
+            answer_key = {item["question_number"]: item["correct_answer"] for item in answers}
             
             print(f"✅ Loaded answer key with {len(answer_key)} questions")
+            self._answer_key = answer_key
             return answer_key
             
         except FileNotFoundError:
@@ -55,16 +105,16 @@ class ConsensusValidator:
             return {}
     
     def load_question_types(self) -> Dict[int, str]:
-        """Load question types from the questions file"""
+        """Load question types from the questions file (cached after the first successful load)"""
+        if self._question_types is not None:
+            return self._question_types
+        
         try:
-            with open(self.questions_file, 'r', encoding='utf-8') as f:
-                questions = json.load(f)
-            
-            question_types = {}
-            for q in questions:
-                question_types[q["question_number"]] = q.get("question_type", "other")
+            questions = self._load_json(self.questions_file)
+            question_types = {q["question_number"]: q.get("question_type", "other") for q in questions}
             
             print(f"✅ Loaded question types for {len(question_types)} questions")
+            self._question_types = question_types
             return question_types
             
         except FileNotFoundError:
@@ -76,11 +126,38 @@ class ConsensusValidator:
     
     def get_available_consensus_reports(self) -> List[str]:
         """Get list of all available consensus reports sorted by date"""
-        pattern = os.path.join(self.consensus_reports_dir, "consensus_report_*.json")
-        files = glob.glob(pattern)
+        if not os.path.isdir(self.consensus_reports_dir):
+            return []
+        
+        with os.scandir(self.consensus_reports_dir) as entries:
+            files = [
+                entry.path for entry in entries
+                if entry.name.startswith("consensus_report_") and entry.name.endswith(".json")
+            ]
         # Sort by filename (which includes timestamp) descending
         return sorted(files, reverse=True)
     
+    def get_latest_consensus_report(self) -> Optional[str]:
+        """Get the path of the most recently written consensus report in a single directory scan
+        
+        Filenames can't be compared for this: vote reports are named by round before timestamp, and
+        consensus_report_final.json has no timestamp at all. Modification time is used instead, so the
+        final report is picked when its analysis finished last (and wins a tie with that run's last round).
+        """
+        if not os.path.isdir(self.consensus_reports_dir):
+            return None
+        
+        latest_key = None
+        latest_path = None
+        with os.scandir(self.consensus_reports_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("consensus_report_") and name.endswith(".json"):
+                    key = (entry.stat().st_mtime_ns, name == "consensus_report_final.json", name)
+                    if latest_key is None or key > latest_key:
+                        latest_key, latest_path = key, entry.path
+        return latest_path
+    
     def get_consensus_report(self, report_filename: Optional[str] = None) -> Optional[str]:
         """Get consensus report path - by default uses consensus_report_final.json"""
         # Default to final consensus report
@@ -102,9 +179,9 @@ class ConsensusValidator:
         print(f"❌ Consensus report '{report_filename}' not found")
         available_reports = self.get_available_consensus_reports()
         if available_reports:
-            print(f"Available reports (showing first 10):")
-            for report in available_reports[:10]:
-                print(f"  - {os.path.basename(report)}")
+            lines = [f"Available reports (showing first 10):"]
+            lines.extend(f"  - {os.path.basename(report)}" for report in available_reports[:10])
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"No consensus reports found in {self.consensus_reports_dir}")
         
@@ -113,8 +190,7 @@ class ConsensusValidator:
     def load_consensus_report(self, filepath: str) -> Optional[Dict]:
         """Load a consensus report"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                report = json.load(f)
+            report = self._load_json(filepath)
             
             print(f"✅ Loaded consensus report with {len(report.get('questions', []))} questions")
             return report
@@ -156,50 +232,61 @@ class ConsensusValidator:
         
         # Validate each question
         validation_results = []
+        # Bind the lookups used on every iteration once, outside the loop
+        question_type_get = question_types.get
+        append_result = validation_results.append
         
         for question_data in consensus_report.get("questions", []):
             question_num = question_data["question_number"]
-            correct_answer = answer_key.get(question_num)
-            
-            if not correct_answer:
+            if question_num not in answer_key:
                 print(f"⚠️  No answer key found for question {question_num}")
                 continue
+            correct_answer = answer_key[question_num]
+            
+            get = question_data.get
             
             # For final reports, use final_consensus_choice if available
-            consensus_choice = question_data.get("final_consensus_choice") or question_data.get("consensus_choice")
-            consensus_percentage = question_data.get("final_consensus_percentage", question_data.get("consensus_percentage", 0.0))
+            consensus_choice = get("final_consensus_choice") or get("consensus_choice")
+            if "final_consensus_percentage" in question_data:
+                consensus_percentage = question_data["final_consensus_percentage"]
+            else:
+                consensus_percentage = get("consensus_percentage", 0.0)
             
             # For final reports, consensus is always achieved (that's why it's final)
-            consensus_achieved = True if "final_consensus_choice" in question_data else question_data.get("consensus_achieved", False)
+            consensus_achieved = True if "final_consensus_choice" in question_data else get("consensus_achieved", False)
             
             # Determine if consensus is correct
-            is_consensus_correct = False
-            if consensus_achieved and consensus_choice:
-                is_consensus_correct = consensus_choice == correct_answer
+            is_consensus_correct = bool(consensus_achieved and consensus_choice) and consensus_choice == correct_answer
             
-            result = ValidationResult(
+            vote_counts = Counter(get("vote_counts", {}))
+            leading_choice = vote_counts.most_common(1)[0][0] if vote_counts else None
+            
+            append_result(ValidationResult(
                 question_number=question_num,
-                question_type=question_types.get(question_num, "other"),
+                question_type=question_type_get(question_num, "other"),
                 correct_answer=correct_answer,
                 consensus_choice=consensus_choice,
                 consensus_achieved=consensus_achieved,
                 consensus_percentage=consensus_percentage,
                 is_consensus_correct=is_consensus_correct,
-                total_votes=question_data.get("total_votes", 0),
-                vote_breakdown=question_data.get("vote_counts", {})
-            )
-            
-            validation_results.append(result)
+                total_votes=get("total_votes", 0),
+                vote_breakdown=vote_counts,
+                leading_choice=leading_choice,
+                correct_votes=vote_counts[correct_answer],
+                vote_history=get("vote_history", [])
+            ))
         
         return validation_results, consensus_report
     
-    def print_model_success_failure_summary(self, results: List[ValidationResult], consensus_report: Dict):
+    def print_model_success_failure_summary(self, results: List[ValidationResult]):
         """Print individual model success/failure statistics with self-correction analysis"""
-        print(f"\n📊 INDIVIDUAL MODEL SUCCESS/FAILURE BREAKDOWN")
-        print("=" * 80)
+        # Collect output lines and write them in one call instead of per-line prints
+        out = []
+        out.append(f"\n📊 INDIVIDUAL MODEL SUCCESS/FAILURE BREAKDOWN")
+        out.append("=" * 80)
         
-        # Track each model's performance on each question
-        model_stats = defaultdict(lambda: {"correct": 0, "incorrect": 0, "total": 0})
+        # Track each model's performance on each question, keyed by (model, "correct"/"incorrect"/"total")
+        model_stats = Counter()
         model_correction_stats = defaultdict(lambda: {
             "corrected_to_right": 0,  # Wrong -> Right
             "corrected_to_wrong": 0,  # Right -> Wrong  
@@ -208,126 +295,79 @@ class ConsensusValidator:
             "total_multi_round": 0    # Questions that went to multiple rounds
         })
         
-        # Get the answer key for comparison
-        answer_key = self.load_answer_key()
-        
-        # Process each question to see how each model performed
+        # Process the vote history captured during validation to track model performance
         for result in results:
-            question_num = result.question_number
-            correct_answer = answer_key.get(question_num)
+            correct_answer = result.correct_answer
+            vote_history = result.vote_history
             
-            if not correct_answer:
+            if not vote_history:
                 continue
             
-            # Check each model's vote for this question
-            if hasattr(result, 'votes_by_doctor') and result.votes_by_doctor:
-                for doctor_name, votes in result.votes_by_doctor.items():
-                    if votes:  # If the doctor voted
-                        model_stats[doctor_name]["total"] += 1
-                        # Take the first vote if multiple (shouldn't happen but just in case)
-                        doctor_vote = votes[0] if isinstance(votes, list) else votes
-                        
-                        if doctor_vote == correct_answer:
-                            model_stats[doctor_name]["correct"] += 1
-                        else:
-                            model_stats[doctor_name]["incorrect"] += 1
-        
-        # Process vote history from consensus report to track model performance
-        for question_data in consensus_report.get("questions", []):
-            question_num = question_data["question_number"]
-            correct_answer = answer_key.get(question_num)
-            vote_history = question_data.get("vote_history", [])
-            
-            if not correct_answer or not vote_history:
-                continue
-            
-            # Process first round votes
-            if vote_history:
-                first_round = vote_history[0]
-                for choice, doctors in first_round.get("votes", {}).items():
-                    for doctor in doctors:
-                        model_stats[doctor]["total"] += 1
-                        if choice == correct_answer:
-                            model_stats[doctor]["correct"] += 1
-                        else:
-                            model_stats[doctor]["incorrect"] += 1
+            # Process first round votes, remembering whether each model started out correct
+            first_votes = {}
+            for choice, doctors in vote_history[0].get("votes", {}).items():
+                is_correct = choice == correct_answer
+                outcome = "correct" if is_correct else "incorrect"
+                for doctor in doctors:
+                    first_votes[doctor] = is_correct
+                    model_stats[doctor, "total"] += 1
+                    model_stats[doctor, outcome] += 1
             
             # Analyze self-correction if multiple rounds
             if len(vote_history) > 1:
-                # Track how each model changed their vote
-                first_round = vote_history[0]
-                last_round = vote_history[-1]
-                
-                # Get each model's first and last vote
-                first_votes = {}
                 last_votes = {}
-                
-                for choice, doctors in first_round.get("votes", {}).items():
-                    for doctor in doctors:
-                        first_votes[doctor] = choice
-                
-                for choice, doctors in last_round.get("votes", {}).items():
+                for choice, doctors in vote_history[-1].get("votes", {}).items():
+                    is_correct = choice == correct_answer
                     for doctor in doctors:
-                        last_votes[doctor] = choice
+                        last_votes[doctor] = is_correct
                 
-                # Analyze changes
-                for doctor in first_votes:
+                # Bucket each model by how its vote changed between the first and last round
+                for doctor, first_correct in first_votes.items():
                     if doctor in last_votes:
-                        model_correction_stats[doctor]["total_multi_round"] += 1
-                        
-                        first_correct = first_votes[doctor] == correct_answer
-                        last_correct = last_votes[doctor] == correct_answer
-                        
-                        if first_correct and last_correct:
-                            model_correction_stats[doctor]["stayed_right"] += 1
-                        elif not first_correct and last_correct:
-                            model_correction_stats[doctor]["corrected_to_right"] += 1
-                        elif first_correct and not last_correct:
-                            model_correction_stats[doctor]["corrected_to_wrong"] += 1
-                        else:  # not first_correct and not last_correct
-                            model_correction_stats[doctor]["stayed_wrong"] += 1
-        
-        # Sort models by accuracy
-        sorted_models = sorted(model_stats.items(), 
-                             key=lambda x: (x[1]["correct"] / x[1]["total"]) if x[1]["total"] > 0 else 0, 
-                             reverse=True)
-        
-        print(f"{'Model Name':<35} {'Correct':<8} {'Incorrect':<10} {'Total':<8} {'Accuracy':<10}")
-        print("-" * 80)
-        
-        for model_name, stats in sorted_models:
+                        correction_stats = model_correction_stats[doctor]
+                        correction_stats["total_multi_round"] += 1
+                        correction_stats[VOTE_TRANSITIONS[(first_correct, last_votes[doctor])]] += 1
+        
+        # Pivot the counters into per-model rows, computing each model's accuracy once
+        model_accuracies = []
+        for model_name in dict.fromkeys(name for name, _ in model_stats):
+            stats = {field: model_stats[model_name, field] for field in ("correct", "incorrect", "total")}
+            accuracy = (stats["correct"] / stats["total"]) * 100 if stats["total"] > 0 else 0.0
+            model_accuracies.append((model_name, stats, accuracy))
+        sorted_models = sorted(model_accuracies, key=lambda x: x[2], reverse=True)
+        
+        out.append(f"{'Model Name':<35} {'Correct':<8} {'Incorrect':<10} {'Total':<8} {'Accuracy':<10}")
+        out.append("-" * 80)
+        
+        for model_name, stats, accuracy in sorted_models:
             if stats["total"] > 0:
-                accuracy = (stats["correct"] / stats["total"]) * 100
-                print(f"{model_name:<35} {stats['correct']:<8} {stats['incorrect']:<10} {stats['total']:<8} {accuracy:<10.1f}%")
+                out.append(f"{model_name:<35} {stats['correct']:<8} {stats['incorrect']:<10} {stats['total']:<8} {accuracy:<10.1f}%")
         
         # Show summary statistics
         if sorted_models:
-            print(f"\n📈 Summary Statistics:")
+            out.append(f"\n📈 Summary Statistics:")
             total_models = len([m for m in sorted_models if m[1]["total"] > 0])
-            best_model = sorted_models[0] if sorted_models else None
-            worst_model = sorted_models[-1] if sorted_models else None
+            best_model = sorted_models[0]
+            worst_model = sorted_models[-1]
             
-            print(f"   Total Active Models: {total_models}")
-            if best_model:
-                best_accuracy = (best_model[1]["correct"] / best_model[1]["total"]) * 100
-                print(f"   🏆 Best Model: {best_model[0]} ({best_accuracy:.1f}%)")
-            if worst_model and worst_model != best_model:
-                worst_accuracy = (worst_model[1]["correct"] / worst_model[1]["total"]) * 100
-                print(f"   🔻 Worst Model: {worst_model[0]} ({worst_accuracy:.1f}%)")
+            out.append(f"   Total Active Models: {total_models}")
+            out.append(f"   🏆 Best Model: {best_model[0]} ({best_model[2]:.1f}%)")
+            if worst_model != best_model:
+                out.append(f"   🔻 Worst Model: {worst_model[0]} ({worst_model[2]:.1f}%)")
             
             # Calculate average accuracy
-            total_correct = sum(stats["correct"] for _, stats in sorted_models)
-            total_answered = sum(stats["total"] for _, stats in sorted_models)
+            total_correct = sum(stats["correct"] for _, stats, _ in sorted_models)
+            total_answered = sum(stats["total"] for _, stats, _ in sorted_models)
             if total_answered > 0:
                 avg_accuracy = (total_correct / total_answered) * 100
-                print(f"   📊 Average Accuracy: {avg_accuracy:.1f}%")
+                out.append(f"   📊 Average Accuracy: {avg_accuracy:.1f}%")
         
         # Show self-correction analysis
         if any(stats["total_multi_round"] > 0 for stats in model_correction_stats.values()):
-            print(f"\n🔄 SELF-CORRECTION ANALYSIS (Multi-Round Questions)")
-            print("=" * 80)
-            print(f"{'Model Name':<35} {'Improved':<10} {'Worsened':<10} {'Stayed Right':<12} {'Stayed Wrong':<12}")
-            print("-" * 80)
+            out.append(f"\n🔄 SELF-CORRECTION ANALYSIS (Multi-Round Questions)")
+            out.append("=" * 80)
+            out.append(f"{'Model Name':<35} {'Improved':<10} {'Worsened':<10} {'Stayed Right':<12} {'Stayed Wrong':<12}")
+            out.append("-" * 80)
             
             # Sort by improvement rate
             correction_sorted = sorted(
@@ -343,52 +383,45 @@ class ConsensusValidator:
                     stayed_right = stats["stayed_right"]
                     stayed_wrong = stats["stayed_wrong"]
                     
-                    print(f"{model_name:<35} {improved:<10} {worsened:<10} {stayed_right:<12} {stayed_wrong:<12}")
+                    out.append(f"{model_name:<35} {improved:<10} {worsened:<10} {stayed_right:<12} {stayed_wrong:<12}")
             
             # Summary
-            print(f"\n📊 Self-Correction Summary:")
+            out.append(f"\n📊 Self-Correction Summary:")
             total_improved = sum(stats["corrected_to_right"] for stats in model_correction_stats.values())
             total_worsened = sum(stats["corrected_to_wrong"] for stats in model_correction_stats.values())
             total_multi_round = sum(stats["total_multi_round"] for stats in model_correction_stats.values())
             
             if total_multi_round > 0:
-                print(f"   Total corrections: {total_improved} improved, {total_worsened} worsened")
-                print(f"   Net improvement rate: {(total_improved - total_worsened) / total_multi_round * 100:+.1f}%")
+                out.append(f"   Total corrections: {total_improved} improved, {total_worsened} worsened")
+                out.append(f"   Net improvement rate: {(total_improved - total_worsened) / total_multi_round * 100:+.1f}%")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def load_individual_test_results(self) -> Dict[str, Dict]:
-        """Load individual test results from all AI models"""
-        test_attempts_dir = "../02_test_attempts"
-        pattern = os.path.join(test_attempts_dir, "*.json")
-        files = glob.glob(pattern)
-        
-        # Group files by model name and find the latest for each
-        model_files = defaultdict(list)
-        
-        for file_path in files:
-            filename = os.path.basename(file_path)
-            # Skip consensus report files
-            if filename.startswith('consensus_report') or filename.startswith('validation_report'):
-                continue
+        """Load individual test results from all AI models (not used by the validation flow itself)"""
+        if not os.path.isdir(self.test_attempts_dir):
+            return {}
+        
+        # Track only the latest (timestamp, path) per model while scanning the directory
+        latest_files = {}
+        
+        with os.scandir(self.test_attempts_dir) as entries:
+            for entry in entries:
+                # Match "model_name_YYYYMMDD_HHMMSS.json", skipping consensus/validation reports
+                match = RESULT_FILENAME_PATTERN.match(entry.name)
+                if not match or not entry.is_file():
+                    continue
                 
-            # Extract model name and timestamp from filename like "model_name_YYYYMMDD_HHMMSS.json"
-            parts = filename.replace('.json', '').split('_')
-            if len(parts) >= 3:
-                # Model name is everything except the last two parts (date and time)
-                model_name = '_'.join(parts[:-2])
-                timestamp = '_'.join(parts[-2:])  # YYYYMMDD_HHMMSS
-                model_files[model_name].append((timestamp, file_path))
-        
-        # Get the latest file for each model
+                model_name, timestamp = match.groups()
+                current = latest_files.get(model_name)
+                if current is None or timestamp > current[0]:
+                    latest_files[model_name] = (timestamp, entry.path)
+        
+        # Load the latest file for each model
         latest_results = {}
-        for model_name, file_list in model_files.items():
-            # Sort by timestamp (descending) and take the first (latest)
-            file_list.sort(key=lambda x: x[0], reverse=True)
-            latest_timestamp, latest_file = file_list[0]
-            
+        for model_name, (latest_timestamp, latest_file) in latest_files.items():
             try:
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    latest_results[model_name] = data
+                latest_results[model_name] = self._load_json(latest_file)
             except Exception as e:
                 print(f"❌ Error loading {latest_file}: {e}")
         
@@ -401,74 +434,82 @@ class ConsensusValidator:
             return
         
         total_questions = len(results)
-        consensus_achieved = sum(1 for r in results if r.consensus_achieved)
-        consensus_correct = sum(1 for r in results if r.is_consensus_correct)
-        
-        print(f"\n🎯 CONSENSUS VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"Total Questions: {total_questions}")
-        print(f"Consensus Achieved: {consensus_achieved}/{total_questions} ({consensus_achieved/total_questions*100:.1f}%)")
-        print(f"Consensus Correct: {consensus_correct}/{consensus_achieved} ({consensus_correct/consensus_achieved*100:.1f}% of consensus)")
-        print(f"Overall Accuracy: {consensus_correct}/{total_questions} ({consensus_correct/total_questions*100:.1f}% of all questions)")
-        
-        # Breakdown by question type
-        type_stats = defaultdict(lambda: {"total": 0, "consensus": 0, "correct": 0})
+        consensus_achieved = 0
+        consensus_correct = 0
+        # Breakdown by question type, keyed by (question type, "total"/"consensus"/"correct")
+        type_stats = Counter()
+        # Only the first few examples of each kind are kept for display; the rest are just counted
+        incorrect_consensus = []
+        incorrect_count = 0
+        no_consensus_but_correct = []
+        no_consensus_count = 0
         
+        # Gather every statistic in a single pass over the results
         for result in results:
             q_type = result.question_type
-            type_stats[q_type]["total"] += 1
+            type_stats[q_type, "total"] += 1
             if result.consensus_achieved:
-                type_stats[q_type]["consensus"] += 1
+                consensus_achieved += 1
+                type_stats[q_type, "consensus"] += 1
                 if result.is_consensus_correct:
-                    type_stats[q_type]["correct"] += 1
-        
-        print(f"\n📋 Accuracy by Question Type:")
-        print(f"{'Type':<8} {'Total':<6} {'Consensus':<10} {'Correct':<8} {'Accuracy':<10}")
-        print("-" * 50)
-        
-        for q_type in sorted(type_stats.keys()):
-            stats = type_stats[q_type]
+                    consensus_correct += 1
+                    type_stats[q_type, "correct"] += 1
+                else:
+                    incorrect_count += 1
+                    if len(incorrect_consensus) < MAX_INCORRECT_SHOWN:
+                        incorrect_consensus.append(result)
+            elif result.leading_choice == result.correct_answer:
+                no_consensus_count += 1
+                if len(no_consensus_but_correct) < MAX_NO_CONSENSUS_SHOWN:
+                    no_consensus_but_correct.append(result)
+        
+        # Collect output lines and write them in one call instead of per-line prints
+        out = []
+        out.append(f"\n🎯 CONSENSUS VALIDATION SUMMARY")
+        out.append("=" * 60)
+        out.append(f"Total Questions: {total_questions}")
+        out.append(f"Consensus Achieved: {consensus_achieved}/{total_questions} ({consensus_achieved/total_questions*100:.1f}%)")
+        out.append(f"Consensus Correct: {consensus_correct}/{consensus_achieved} ({consensus_correct/consensus_achieved*100:.1f}% of consensus)")
+        out.append(f"Overall Accuracy: {consensus_correct}/{total_questions} ({consensus_correct/total_questions*100:.1f}% of all questions)")
+        
+        out.append(f"\n📋 Accuracy by Question Type:")
+        out.append(f"{'Type':<8} {'Total':<6} {'Consensus':<10} {'Correct':<8} {'Accuracy':<10}")
+        out.append("-" * 50)
+        
+        for q_type in sorted({q_type for q_type, _ in type_stats}):
+            stats = {field: type_stats[q_type, field] for field in ("total", "consensus", "correct")}
             consensus_rate = (stats["consensus"] / stats["total"]) * 100
             if stats["consensus"] > 0:
                 accuracy_rate = (stats["correct"] / stats["consensus"]) * 100
             else:
                 accuracy_rate = 0.0
             
-            print(f"{q_type:<8} {stats['total']:<6} {stats['consensus']:<10} {stats['correct']:<8} {accuracy_rate:<10.1f}%")
+            out.append(f"{q_type:<8} {stats['total']:<6} {stats['consensus']:<10} {stats['correct']:<8} {accuracy_rate:<10.1f}%")
         
         # Show incorrect consensus decisions
-        incorrect_consensus = [r for r in results if r.consensus_achieved and not r.is_consensus_correct]
-        
         if incorrect_consensus:
-            print(f"\n❌ Incorrect Consensus Decisions ({len(incorrect_consensus)}):")
-            for result in incorrect_consensus[:10]:  # Show first 10
-                print(f"  Q{result.question_number}: Consensus={result.consensus_choice} "
+            out.append(f"\n❌ Incorrect Consensus Decisions ({incorrect_count}):")
+            for result in incorrect_consensus:
+                out.append(f"  Q{result.question_number}: Consensus={result.consensus_choice} "
                       f"({result.consensus_percentage:.1f}%), Correct={result.correct_answer}")
                 
-                # Show vote breakdown
-                vote_summary = []
-                for choice, count in sorted(result.vote_breakdown.items()):
-                    marker = "✓" if choice == result.correct_answer else " "
-                    vote_summary.append(f"{choice}:{count}{marker}")
-                print(f"    Votes: {', '.join(vote_summary)}")
-        
-        # Show questions where consensus was achieved but wrong
-        no_consensus_but_correct = []
-        for result in results:
-            if not result.consensus_achieved:
-                # Check if the correct answer had the most votes
-                if result.vote_breakdown:
-                    most_voted = max(result.vote_breakdown.items(), key=lambda x: x[1])
-                    if most_voted[0] == result.correct_answer:
-                        no_consensus_but_correct.append(result)
-        
+                # Show vote breakdown in fixed choice order
+                vote_breakdown = result.vote_breakdown
+                vote_summary = [
+                    f"{choice}:{vote_breakdown[choice]}{'✓' if choice == result.correct_answer else ' '}"
+                    for choice in ANSWER_CHOICES if choice in vote_breakdown
+                ]
+                out.append(f"    Votes: {', '.join(vote_summary)}")
+        
+        # Show questions where consensus was not reached but the correct answer led
         if no_consensus_but_correct:
-            print(f"\n🤔 No Consensus but Correct Answer Led ({len(no_consensus_but_correct)}):")
-            for result in no_consensus_but_correct[:5]:  # Show first 5
-                correct_votes = result.vote_breakdown.get(result.correct_answer, 0)
-                percentage = (correct_votes / result.total_votes) * 100
-                print(f"  Q{result.question_number}: Correct answer {result.correct_answer} "
-                      f"had {correct_votes}/{result.total_votes} votes ({percentage:.1f}%)")
+            out.append(f"\n🤔 No Consensus but Correct Answer Led ({no_consensus_count}):")
+            for result in no_consensus_but_correct:
+                percentage = (result.correct_votes / result.total_votes) * 100
+                out.append(f"  Q{result.question_number}: Correct answer {result.correct_answer} "
+                      f"had {result.correct_votes}/{result.total_votes} votes ({percentage:.1f}%)")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def save_validation_report(self, results: List[ValidationResult], filename: Optional[str] = None):
         """Save detailed validation report to JSON"""
@@ -491,30 +532,23 @@ class ConsensusValidator:
                 "consensus_accuracy": (consensus_correct / consensus_achieved * 100) if consensus_achieved > 0 else 0,
                 "overall_accuracy": (consensus_correct / total_questions * 100) if total_questions > 0 else 0
             },
-            "questions": []
+            # Results are converted one at a time by _result_to_json while json.dump streams them out
+            "questions": results
         }
         
-        for result in results:
-            question_data = {
-                "question_number": result.question_number,
-                "question_type": result.question_type,
-                "correct_answer": result.correct_answer,
-                "consensus_choice": result.consensus_choice,
-                "consensus_achieved": result.consensus_achieved,
-                "consensus_percentage": result.consensus_percentage,
-                "is_consensus_correct": result.is_consensus_correct,
-                "total_votes": result.total_votes,
-                "vote_breakdown": result.vote_breakdown
-            }
-            report["questions"].append(question_data)
-        
         filepath = os.path.join(".", filename)
         
+        # Write to a temp file and swap it into place so a failed write never leaves a partial report
+        tmp_filepath = filepath + ".tmp"
+        
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            with open(tmp_filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=_result_to_json)
+            os.replace(tmp_filepath, filepath)
             print(f"\n💾 Validation report saved to: {filepath}")
         except Exception as e:
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
             print(f"\n❌ Error saving validation report: {e}")
 
 def main():
@@ -526,6 +560,8 @@ def main():
                        help="Specific consensus report to validate (e.g., consensus_report_20250710_121105.json)")
     parser.add_argument("--list", action="store_true",
                        help="List available consensus reports")
+    parser.add_argument("--latest", action="store_true",
+                       help="Validate the most recently written consensus report (final or any vote round) instead of consensus_report_final.json")
     
     args = parser.parse_args()
     
@@ -535,11 +571,11 @@ def main():
     if args.list:
         available_reports = validator.get_available_consensus_reports()
         if available_reports:
-            print("📂 Available consensus reports:")
-            for i, report in enumerate(available_reports[:20]):  # Show first 20
-                print(f"  {i+1}. {os.path.basename(report)}")
+            lines = ["📂 Available consensus reports:"]
+            lines.extend(f"  {i+1}. {os.path.basename(report)}" for i, report in enumerate(available_reports[:20]))  # Show first 20
             if len(available_reports) > 20:
-                print(f"  ... and {len(available_reports) - 20} more")
+                lines.append(f"  ... and {len(available_reports) - 20} more")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("❌ No consensus reports found")
         return
@@ -548,8 +584,15 @@ def main():
     print("Comparing AI consensus with official answer key...")
     print("=" * 60)
     
+    report_filename = args.report
+    if args.latest and not report_filename:
+        report_filename = validator.get_latest_consensus_report()
+        if not report_filename:
+            print("❌ No consensus reports found")
+            return
+    
     # Validate consensus
-    results, consensus_report = validator.validate_consensus(args.report)
+    results, _ = validator.validate_consensus(report_filename)
     
     if not results:
         print("❌ No validation results to display")
@@ -559,7 +602,7 @@ def main():
     validator.print_validation_summary(results)
     
     # Print individual model success/failure breakdown with self-correction analysis
-    validator.print_model_success_failure_summary(results, consensus_report)
+    validator.print_model_success_failure_summary(results)
     
     # Save detailed report
     validator.save_validation_report(results)
@@ -4,16 +4,32 @@ Analysis script to identify AI models with the best consensus independence.
 This script analyzes which models voted correctly when the consensus was wrong.
 """
 
+import hashlib
+import heapq
 import json
 import os
-from collections import defaultdict
-from typing import Dict, List, Tuple, Set
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple, Set
+
+# Per-file tallies from get_individual_performance, cached as plain JSON next to this script
+# rather than inside the shared results directory
+PERFORMANCE_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache',
+                                      'individual_performance.json')
 
 def load_json(file_path: str) -> dict:
     """Load JSON data from file."""
     with open(file_path, 'r') as f:
         return json.load(f)
 
+@dataclass(slots=True)
+class ModelStat:
+    """A model's record of voting against a wrong consensus"""
+    correct_when_consensus_wrong: int = 0
+    total_wrong_consensus_questions: int = 0
+    independence_score: float = 0.0
+    correct_votes_details: List[Dict] = field(default_factory=list)
+
 def get_wrong_consensus_questions(validation_report: dict) -> List[int]:
     """Extract question numbers where consensus was wrong."""
     wrong_questions = []
@@ -22,136 +38,226 @@ def get_wrong_consensus_questions(validation_report: dict) -> List[int]:
             wrong_questions.append(question['question_number'])
     return wrong_questions
 
-def analyze_consensus_voting(consensus_report: dict, wrong_questions: List[int], 
-                           validation_report: dict) -> Dict[str, Dict]:
+def analyze_consensus_voting(consensus_report: dict, wrong_questions: FrozenSet[int], 
+                           correct_answers: Dict[int, str]) -> Tuple[Dict[str, ModelStat], List[Dict]]:
     """
     Analyze which models voted correctly when consensus was wrong.
-    Returns model statistics including independence scores.
+    Returns model statistics including independence scores, plus a compact summary
+    of each wrong consensus question so callers don't need to walk the report again.
     """
-    model_stats = defaultdict(lambda: {
-        'correct_when_consensus_wrong': 0,
-        'total_wrong_consensus_questions': 0,
-        'independence_score': 0.0,
-        'correct_votes_details': []
-    })
+    # Accumulate column-wise: each model gets a row index (in first-seen order) into
+    # flat per-field lists, and per-model stat dicts are only built once at the end
+    model_index = {}
+    correct_counts = []
+    correct_details = []
     
-    # Create a mapping of question numbers to correct answers
-    correct_answers = {}
-    for question in validation_report['questions']:
-        correct_answers[question['question_number']] = question['correct_answer']
+    def model_row(model: str) -> int:
+        row = model_index.get(model)
+        if row is None:
+            row = model_index[model] = len(correct_counts)
+            correct_counts.append(0)
+            correct_details.append([])
+        return row
+    
+    wrong_question_summaries = []
     
     # Analyze each question where consensus was wrong
     for question in consensus_report['questions']:
         if question['question_number'] in wrong_questions:
             correct_answer = correct_answers[question['question_number']]
             
-            # Look through all voting rounds to find who voted correctly
-            if 'vote_history' in question:
-                # Use the final round votes to see who stood their ground
-                final_round = question['vote_history'][-1]
-                
-                # Find models that voted for the correct answer in the final round
-                if correct_answer in final_round['votes']:
-                    correct_voters = final_round['votes'][correct_answer]
-                    
-                    for model in correct_voters:
-                        model_stats[model]['correct_when_consensus_wrong'] += 1
-                        model_stats[model]['correct_votes_details'].append({
-                            'question': question['question_number'],
-                            'correct_answer': correct_answer,
-                            'consensus_choice': question['final_consensus_choice'],
-                            'consensus_percentage': question['final_consensus_percentage']
-                        })
+            # Use the final round votes to see who stood their ground
+            vote_history = question.get('vote_history')
+            final_votes = vote_history[-1]['votes'] if vote_history else None
+            
+            wrong_question_summaries.append({
+                'question_number': question['question_number'],
+                'question_type': question.get('question_type', 'Unknown'),
+                'correct_answer': correct_answer,
+                'consensus_choice': question['final_consensus_choice'],
+                'consensus_percentage': question['final_consensus_percentage'],
+                'final_votes': final_votes
+            })
+            
+            # Find models that voted for the correct answer in the final round
+            if final_votes is not None and correct_answer in final_votes:
+                correct_voters = final_votes[correct_answer]
                 
-                # Count total wrong consensus questions for each model that participated
-                for round_data in question['vote_history']:
-                    for choice_votes in round_data['votes'].values():
-                        for model in choice_votes:
-                            if model not in [stats['model'] for stats in model_stats.values() if 'model' in stats]:
-                                model_stats[model]['total_wrong_consensus_questions'] = len(wrong_questions)
+                for model in correct_voters:
+                    row = model_row(model)
+                    correct_counts[row] += 1
+                    correct_details[row].append({
+                        'question': question['question_number'],
+                        'correct_answer': correct_answer,
+                        'consensus_choice': question['final_consensus_choice'],
+                        'consensus_percentage': question['final_consensus_percentage']
+                    })
+            
+            # List every model that took part, even if it never voted correctly; the
+            # per-model totals are filled in after the loop
+            for round_data in vote_history or ():
+                for choice_votes in round_data['votes'].values():
+                    for model in choice_votes:
+                        model_row(model)
+            
+            # Stop scanning once every wrong question has been found
+            if len(wrong_question_summaries) == len(wrong_questions):
+                break
     
     # Calculate independence scores
-    for model, stats in model_stats.items():
-        if len(wrong_questions) > 0:
-            stats['independence_score'] = stats['correct_when_consensus_wrong'] / len(wrong_questions)
-        stats['total_wrong_consensus_questions'] = len(wrong_questions)
+    total_wrong = len(wrong_questions)
+    model_stats = {}
+    for model, row in model_index.items():
+        model_stats[model] = ModelStat(
+            correct_when_consensus_wrong=correct_counts[row],
+            total_wrong_consensus_questions=total_wrong,
+            independence_score=correct_counts[row] / total_wrong if total_wrong > 0 else 0.0,
+            correct_votes_details=correct_details[row]
+        )
     
-    return dict(model_stats)
+    return model_stats, wrong_question_summaries
+
+def performance_cache_key(results_dir: str, correct_answers: dict) -> str:
+    """Hash everything a cached tally depends on besides the file itself: which folder, the answer key
+    and the filename-to-model mapping."""
+    payload = json.dumps([os.path.abspath(results_dir), sorted(correct_answers.items()), _NAME_MAPPINGS],
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def load_performance_cache(cache_path: str, cache_key: str) -> Dict[str, dict]:
+    """Load cached per-file tallies, or an empty dict if missing, unreadable or for a different key."""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+        if cache['key'] == cache_key:
+            return cache['files']
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Ignoring unreadable performance cache {cache_path}: {e}")
+    return {}
+
+def save_performance_cache(cache_path: str, cache_key: str, files: Dict[str, dict]):
+    """Persist per-file tallies keyed by filename with their (mtime, size) signature."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({'key': cache_key, 'files': files}, f)
+    except OSError as e:
+        print(f"Could not write performance cache {cache_path}: {e}")
 
 def get_individual_performance(test_results_dir: str, correct_answers: dict) -> Dict[str, Dict]:
     """
     Get individual model performance from standalone tests.
     """
-    model_performance = defaultdict(lambda: {
-        'total_questions': 0,
-        'correct_answers': 0,
-        'accuracy': 0.0,
-        'test_file': ''
-    })
+    model_performance = {}
     
     # Look for test results in the first round (standalone performance)
     first_round_dir = os.path.join(test_results_dir, 'test_20250710_195405')
     
     if os.path.exists(first_round_dir):
-        for filename in os.listdir(first_round_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(first_round_dir, filename)
+        # Result files don't change once a run finishes, so reuse per-file tallies from the previous
+        # run unless the file's mtime/size, the answer key or the model name mapping changed
+        cache_key = performance_cache_key(first_round_dir, correct_answers)
+        cached_files = load_performance_cache(PERFORMANCE_CACHE_FILE, cache_key)
+        fresh_files = {}
+        
+        with os.scandir(first_round_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith('.json'):
+                    continue
+                file_path = entry.path
                 
                 try:
-                    test_data = load_json(file_path)
+                    stat = entry.stat()
+                    signature = [stat.st_mtime_ns, stat.st_size]
+                    cached = cached_files.get(filename)
+                    if cached is not None and cached['signature'] == signature:
+                        fresh_files[filename] = cached
+                        if cached['record'] is not None:
+                            model_performance[cached['model_name']] = cached['record']
+                        continue
+                    
+                    # Parse straight from bytes; only the per-file tally below is kept
+                    with open(file_path, 'rb') as f:
+                        test_data = json.loads(f.read())
                     
-                    # Extract model name from filename or test data
-                    model_name = extract_model_name(filename, test_data)
+                    # Extract model name from filename
+                    model_name = extract_model_name(filename)
+                    record = None
                     
                     if 'results' in test_data:
-                        total = len(test_data['results'])
+                        results = test_data['results']
+                        total = len(results)
                         correct = 0
                         
-                        for result in test_data['results']:
-                            question_num = result.get('question_number')
-                            answer = result.get('selected_answer', '').strip().upper()
-                            
-                            if question_num in correct_answers:
-                                if answer == correct_answers[question_num]:
+                        for result in results:
+                            expected = correct_answers.get(result.get('question_number'))
+                            if expected is not None:
+                                # selected_answer is null when the model's response could not be parsed
+                                answer = (result.get('selected_answer') or '').strip().upper()
+                                if answer == expected:
                                     correct += 1
                         
-                        model_performance[model_name] = {
+                        record = {
                             'total_questions': total,
                             'correct_answers': correct,
                             'accuracy': correct / total if total > 0 else 0.0,
                             'test_file': filename
                         }
+                        model_performance[model_name] = record
+                    
+                    fresh_files[filename] = {'signature': signature, 'model_name': model_name, 'record': record}
                 
                 except Exception as e:
                     print(f"Error processing {filename}: {e}")
+        
+        if fresh_files != cached_files:
+            save_performance_cache(PERFORMANCE_CACHE_FILE, cache_key, fresh_files)
     
-    return dict(model_performance)
+    return model_performance
 
-def extract_model_name(filename: str, test_data: dict) -> str:
-    """Extract standardized model name from filename or test data."""
+# Mapping to standardize result-file name prefixes into doctor names
+_NAME_MAPPINGS = {
+    'claude_sonnet_3_5th': 'Dr. Claude Sonnet the 3.5th',
+    'claude_sonnet_3_7th': 'Dr. Claude Sonnet the 3.7th', 
+    'claude_sonnet_4th': 'Dr. Claude Sonnet the 4th',
+    'deepseek_v3': 'Dr. DeepSeek V3',
+    'gemini_flash_2_5th': 'Dr. Gemini Flash the 2.5th',
+    'gemini_flash_preview_2_5th': 'Dr. Gemini Flash Preview the 2.5th',
+    'gemini_pro_2_5th': 'Dr. Gemini Pro the 2.5th',
+    'gpt_4_1': 'Dr. GPT 4.1',
+    'gpt_4_1_mini': 'Dr. GPT 4.1 Mini',
+    'gpt_4o': 'Dr. GPT 4o',
+    'gpt_4o_mini': 'Dr. GPT 4o Mini',
+    'mistral_medium': 'Dr. Mistral Medium'
+}
+
+def extract_model_name(filename: str) -> str:
+    """Extract standardized model name from filename."""
     # Remove timestamp and file extension
     name_part = filename.split('_20250710')[0]
     
-    # Mapping to standardize names
-    name_mappings = {
-        'claude_sonnet_3_5th': 'Dr. Claude Sonnet the 3.5th',
-        'claude_sonnet_3_7th': 'Dr. Claude Sonnet the 3.7th', 
-        'claude_sonnet_4th': 'Dr. Claude Sonnet the 4th',
-        'deepseek_v3': 'Dr. DeepSeek V3',
-        'gemini_flash_2_5th': 'Dr. Gemini Flash the 2.5th',
-        'gemini_flash_preview_2_5th': 'Dr. Gemini Flash Preview the 2.5th',
-        'gemini_pro_2_5th': 'Dr. Gemini Pro the 2.5th',
-        'gpt_4_1': 'Dr. GPT 4.1',
-        'gpt_4_1_mini': 'Dr. GPT 4.1 Mini',
-        'gpt_4o': 'Dr. GPT 4o',
-        'gpt_4o_mini': 'Dr. GPT 4o Mini',
-        'mistral_medium': 'Dr. Mistral Medium'
-    }
-    
-    return name_mappings.get(name_part, name_part)
+    return _NAME_MAPPINGS.get(name_part, name_part)
+
+def top_k_sorted(items, key, top_k: Optional[int] = None) -> list:
+    """Sort items by key descending, selecting only the top K with a heap when top_k is given."""
+    if top_k is not None:
+        return heapq.nlargest(top_k, items, key=key)
+    return sorted(items, key=key, reverse=True)
 
 def main():
     """Main analysis function."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="AI Model Consensus Independence Analysis")
+    parser.add_argument("--top-k", type=int, default=None,
+                       help="Only rank the top K models in the leaderboards (default: all models)")
+    args = parser.parse_args()
+    if args.top_k is not None and args.top_k < 1:
+        parser.error("--top-k must be a positive integer")
+    
     print("🔍 Analyzing AI Model Consensus Independence")
     print("=" * 50)
     
@@ -165,19 +271,19 @@ def main():
     validation_report = load_json(validation_file)
     consensus_report = load_json(consensus_file)
     
-    # Extract correct answers for individual performance analysis
-    correct_answers = {}
-    for question in validation_report['questions']:
-        correct_answers[question['question_number']] = question['correct_answer']
+    # Extract correct answers once; shared by the consensus and individual performance analyses
+    correct_answers = {q['question_number']: q['correct_answer'] for q in validation_report['questions']}
     
     # Get questions where consensus was wrong
     wrong_questions = get_wrong_consensus_questions(validation_report)
     print(f"❌ Found {len(wrong_questions)} questions where consensus was wrong")
     print(f"   Questions: {sorted(wrong_questions)}")
+    # Set form for O(1) membership checks while scanning the consensus report
+    wrong_question_set = frozenset(wrong_questions)
     
     # Analyze consensus independence
     print("\n🎯 Analyzing consensus independence...")
-    model_independence = analyze_consensus_voting(consensus_report, wrong_questions, validation_report)
+    model_independence, wrong_question_summaries = analyze_consensus_voting(consensus_report, wrong_question_set, correct_answers)
     
     # Get individual performance
     print("📊 Analyzing individual performance...")
@@ -188,62 +294,76 @@ def main():
     print("🏆 MODEL CONSENSUS INDEPENDENCE ANALYSIS RESULTS")
     print("=" * 70)
     
-    # Sort models by independence score
-    sorted_models = sorted(model_independence.items(), 
-                          key=lambda x: x[1]['independence_score'], 
-                          reverse=True)
+    # Sort models by independence score (only the top K are selected when --top-k is given)
+    sorted_models = top_k_sorted(model_independence.items(), lambda x: x[1].independence_score, args.top_k)
     
     print(f"\n📈 TOP PERFORMERS (Independence Score = Correct when consensus wrong / Total wrong consensus questions)")
     print(f"   Total questions where consensus was wrong: {len(wrong_questions)}")
     print("-" * 70)
     
+    lines = []
     for i, (model, stats) in enumerate(sorted_models, 1):
-        independence_score = stats['independence_score']
-        correct_count = stats['correct_when_consensus_wrong']
+        independence_score = stats.independence_score
+        correct_count = stats.correct_when_consensus_wrong
         
         # Get individual performance if available
         individual_acc = individual_performance.get(model, {}).get('accuracy', 0.0)
         
-        print(f"{i:2d}. {model}")
-        print(f"    🎯 Independence Score: {independence_score:.3f} ({correct_count}/{len(wrong_questions)})")
-        print(f"    📊 Individual Accuracy: {individual_acc:.3f}")
-        print(f"    🔄 Consensus Resistance: {correct_count} times voted correctly vs wrong consensus")
+        lines.append(f"{i:2d}. {model}")
+        lines.append(f"    🎯 Independence Score: {independence_score:.3f} ({correct_count}/{len(wrong_questions)})")
+        lines.append(f"    📊 Individual Accuracy: {individual_acc:.3f}")
+        lines.append(f"    🔄 Consensus Resistance: {correct_count} times voted correctly vs wrong consensus")
         
-        if stats['correct_votes_details']:
-            print(f"    ✅ Correct votes on questions: {[d['question'] for d in stats['correct_votes_details'][:5]]}{'...' if len(stats['correct_votes_details']) > 5 else ''}")
-        print()
+        if stats.correct_votes_details:
+            lines.append(f"    ✅ Correct votes on questions: {[d['question'] for d in stats.correct_votes_details[:5]]}{'...' if len(stats.correct_votes_details) > 5 else ''}")
+        lines.append("")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Detailed breakdown of wrong consensus questions
     print("\n📋 DETAILED BREAKDOWN OF WRONG CONSENSUS QUESTIONS")
     print("-" * 70)
     
-    for question in consensus_report['questions']:
-        if question['question_number'] in wrong_questions:
-            correct_answer = correct_answers[question['question_number']]
-            consensus_choice = question['final_consensus_choice']
-            consensus_pct = question['final_consensus_percentage']
-            
-            print(f"\n❌ Question {question['question_number']}: {question.get('question_type', 'Unknown')}")
-            print(f"   Correct Answer: {correct_answer} | Consensus Choice: {consensus_choice} ({consensus_pct:.1f}%)")
-            
-            # Show who voted correctly in the final round
-            if 'vote_history' in question and question['vote_history']:
-                final_round = question['vote_history'][-1]
-                if correct_answer in final_round['votes']:
-                    correct_voters = final_round['votes'][correct_answer]
-                    print(f"   🎯 Models that voted CORRECTLY: {', '.join(correct_voters)}")
-                else:
-                    print(f"   😞 No models voted correctly in final round")
+    lines = []
+    for summary in wrong_question_summaries:
+        correct_answer = summary['correct_answer']
+        consensus_choice = summary['consensus_choice']
+        consensus_pct = summary['consensus_percentage']
+        
+        lines.append(f"\n❌ Question {summary['question_number']}: {summary['question_type']}")
+        lines.append(f"   Correct Answer: {correct_answer} | Consensus Choice: {consensus_choice} ({consensus_pct:.1f}%)")
+        
+        # Show who voted correctly in the final round
+        final_votes = summary['final_votes']
+        if final_votes is not None:
+            if correct_answer in final_votes:
+                correct_voters = final_votes[correct_answer]
+                lines.append(f"   🎯 Models that voted CORRECTLY: {', '.join(correct_voters)}")
+            else:
+                lines.append(f"   😞 No models voted correctly in final round")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Calculate composite scores
     print("\n" + "=" * 70)
     print("🎖️ COMPOSITE RANKING (Independence + Individual Accuracy)")
     print("=" * 70)
     
+    # Build composite scores and the summary reductions (average, best, >10%) in one pass
     composite_scores = []
+    independence_total = 0.0
+    best_independence_model = None
+    high_independence = []
     for model, independence_stats in model_independence.items():
         individual_acc = individual_performance.get(model, {}).get('accuracy', 0.0)
-        independence_score = independence_stats['independence_score']
+        independence_score = independence_stats.independence_score
+        
+        independence_total += independence_score
+        if best_independence_model is None or independence_score > best_independence_model[1]:
+            best_independence_model = (model, independence_score)
+        # Models with high independence (>0.1 since max is 0.192)
+        if independence_score > 0.1:
+            high_independence.append(model)
         
         # Composite score: 60% independence, 40% individual accuracy
         # This weights independence higher since it's the main focus
@@ -254,15 +374,16 @@ def main():
             'composite_score': composite_score,
             'independence_score': independence_score,
             'individual_accuracy': individual_acc,
-            'correct_when_wrong': independence_stats['correct_when_consensus_wrong']
+            'correct_when_wrong': independence_stats.correct_when_consensus_wrong
         })
     
     # Sort by composite score
-    composite_scores.sort(key=lambda x: x['composite_score'], reverse=True)
+    composite_scores = top_k_sorted(composite_scores, lambda x: x['composite_score'], args.top_k)
     
     print("Ranking based on 60% Independence Score + 40% Individual Accuracy:")
     print("-" * 70)
     
+    lines = []
     for i, score_data in enumerate(composite_scores, 1):
         model = score_data['model']
         composite = score_data['composite_score']
@@ -270,11 +391,13 @@ def main():
         accuracy = score_data['individual_accuracy']
         correct_count = score_data['correct_when_wrong']
         
-        print(f"{i:2d}. {model}")
-        print(f"    🏆 Composite Score: {composite:.3f}")
-        print(f"    🎯 Independence: {independence:.3f} ({correct_count}/26 correct vs wrong consensus)")
-        print(f"    📊 Individual Accuracy: {accuracy:.3f}")
-        print()
+        lines.append(f"{i:2d}. {model}")
+        lines.append(f"    🏆 Composite Score: {composite:.3f}")
+        lines.append(f"    🎯 Independence: {independence:.3f} ({correct_count}/26 correct vs wrong consensus)")
+        lines.append(f"    📊 Individual Accuracy: {accuracy:.3f}")
+        lines.append("")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Summary statistics
     print("\n" + "=" * 70)
@@ -282,34 +405,26 @@ def main():
     print("=" * 70)
     
     if model_independence:
-        avg_independence = sum(stats['independence_score'] for stats in model_independence.values()) / len(model_independence)
-        best_independence_model = max(model_independence.items(), key=lambda x: x[1]['independence_score'])
+        avg_independence = independence_total / len(model_independence)
         best_composite_model = composite_scores[0]
         
         print(f"Average Independence Score: {avg_independence:.3f}")
-        print(f"Best Independent Model: {best_independence_model[0]} (Score: {best_independence_model[1]['independence_score']:.3f})")
+        print(f"Best Independent Model: {best_independence_model[0]} (Score: {best_independence_model[1]:.3f})")
         print(f"Best Composite Model: {best_composite_model['model']} (Score: {best_composite_model['composite_score']:.3f})")
         
-        # Models with high independence (>0.1 since max is 0.192)
-        high_independence = [name for name, stats in model_independence.items() 
-                           if stats['independence_score'] > 0.1]
         print(f"Models with >10% independence: {len(high_independence)}")
         if high_independence:
             print(f"   {', '.join(high_independence)}")
         
         # Key insights
         print(f"\n🔍 KEY INSIGHTS:")
-        print(f"• Out of 26 wrong consensus decisions, only {len([q for q in wrong_questions if any(stats['correct_when_consensus_wrong'] > 0 for stats in model_independence.values())])} had any model vote correctly")
+        print(f"• Out of 26 wrong consensus decisions, only {len([q for q in wrong_questions if any(stats.correct_when_consensus_wrong > 0 for stats in model_independence.values())])} had any model vote correctly")
         
         # Questions where NO model voted correctly
-        no_correct_questions = []
-        for question in consensus_report['questions']:
-            if question['question_number'] in wrong_questions:
-                correct_answer = correct_answers[question['question_number']]
-                if 'vote_history' in question and question['vote_history']:
-                    final_round = question['vote_history'][-1]
-                    if correct_answer not in final_round['votes'] or not final_round['votes'][correct_answer]:
-                        no_correct_questions.append(question['question_number'])
+        no_correct_questions = [
+            summary['question_number'] for summary in wrong_question_summaries
+            if summary['final_votes'] is not None and not summary['final_votes'].get(summary['correct_answer'])
+        ]
         
         print(f"• {len(no_correct_questions)} questions had NO models vote correctly: {sorted(no_correct_questions)}")
         print(f"• This suggests strong groupthink on questions: {', '.join(map(str, sorted(no_correct_questions)[:5]))}{'...' if len(no_correct_questions) > 5 else ''}")